@@ -1,7 +1,36 @@
+from starlette.requests import Request
 from starlette_admin.contrib.sqla import ModelView
+
+from app.core.connections.cache import get_redis_client
 from app.models.v1.header import LogoModel, MenuItemModel, ContactInfoModel
+from app.services.v1.header.service import HeaderService
 from .base import admin
 
-admin.add_view(ModelView(LogoModel))
-admin.add_view(ModelView(MenuItemModel))
-admin.add_view(ModelView(ContactInfoModel)) 
\ No newline at end of file
+
+class HeaderModelView(ModelView):
+    """
+    Представление моделей header в админ-панели.
+
+    После любого изменения сбрасывает кеш ответа GET /header,
+    чтобы сайт сразу получил новые данные.
+    """
+
+    async def _invalidate_header_cache(self) -> None:
+        redis = await get_redis_client()
+        await redis.delete(HeaderService.CACHE_KEY)
+
+    async def after_create(self, request: Request, obj) -> None:
+        await self._invalidate_header_cache()
+
+    async def after_edit(self, request: Request, obj) -> None:
+        await self._invalidate_header_cache()
+
+    async def after_delete(self, request: Request, obj) -> None:
+        await self._invalidate_header_cache()
+
+
+# Модели, доступные для редактирования в админ-панели
+ADMIN_MODELS = (LogoModel, MenuItemModel, ContactInfoModel)
+
+for model in ADMIN_MODELS:
+    admin.add_view(HeaderModelView(model))
@@ -10,17 +10,90 @@
 - Проверку прав доступа
 - Безопасный выход из системы
 """
+import json
+import logging
+from dataclasses import asdict, dataclass
+
+from redis.asyncio import Redis
+from sqlalchemy import Row
 from starlette.requests import Request
 from starlette.responses import Response
 from starlette_admin.auth import AdminConfig, AdminUser, AuthProvider
 from starlette_admin.exceptions import LoginFailed
+from starsessions import regenerate_session_id
 
-from app.core.connections.database import get_db_session
+from app.core.connections.database import database_client
 from app.core.connections.cache import get_redis_client
-from app.core.security.password import PasswordHasher
+from app.core.security.password import DUMMY_PASSWORD_HASH, PasswordHasher
 from app.services.v1.auth.service import AuthService
 from app.models.v1.users import UserRole
 
+logger = logging.getLogger(__name__)
+
+# Время жизни кеша данных администратора в Redis (в секундах)
+ADMIN_USER_CACHE_TTL = 60
+
+# Значение роли администратора: в кеше роль хранится строкой,
+# поэтому сравнение идет с готовой строкой без обращения к enum
+ADMIN_ROLE = UserRole.ADMIN.value
+
+
+@dataclass
+class AdminSessionUser:
+    """
+    Облегченное представление администратора для кеша в Redis.
+
+    Attributes:
+        id (int): Идентификатор пользователя
+        username (str): Имя пользователя
+        email (str): Email пользователя
+        role (str): Роль пользователя
+    """
+
+    id: int
+    username: str
+    email: str
+    role: str
+
+
+def get_admin_cache_key(username: str) -> str:
+    """
+    Формирует ключ кеша администратора в Redis.
+
+    Args:
+        username (str): Имя пользователя или email из сессии
+
+    Returns:
+        str: Ключ вида admin:user:{username}
+    """
+    return f"admin:user:{username}"
+
+
+async def cache_admin_user(redis: Redis, username: str, user: Row) -> AdminSessionUser:
+    """
+    Сохраняет данные администратора в кеш Redis.
+
+    Args:
+        redis (Redis): Клиент Redis
+        username (str): Имя пользователя или email из сессии
+        user (Row): Строка с данными пользователя из базы данных
+
+    Returns:
+        AdminSessionUser: Облегченное представление администратора
+    """
+    admin_user = AdminSessionUser(
+        id=user.id,
+        username=user.username,
+        email=user.email,
+        role=user.role.value,
+    )
+    await redis.setex(
+        get_admin_cache_key(username),
+        ADMIN_USER_CACHE_TTL,
+        json.dumps(asdict(admin_user)),
+    )
+    return admin_user
+
 
 class CustomAuthProvider(AuthProvider):
     """
@@ -55,24 +128,39 @@ class CustomAuthProvider(AuthProvider):
             LoginFailed: При неверных учетных данных или отсутствии прав админа
         """
         redis = await get_redis_client()
-        async for session in get_db_session():
+        session_factory = await database_client.connect()
+        async with session_factory() as session:
             try:
                 service = AuthService(session, redis)
 
                 # Получаем пользователя по логину
-                user = await service.data_manager.get_user_by_identifier(username)
+                user = await service.data_manager.get_user_credentials(username)
+
+                # Проверяем пароль всегда, даже если пользователь не найден,
+                # чтобы время ответа не выдавало существование учетной записи
+                hashed_password = (
+                    user.hashed_password
+                    if user and user.hashed_password
+                    else DUMMY_PASSWORD_HASH
+                )
+                is_password_valid = await PasswordHasher.verify_async(
+                    hashed_password, password
+                )
 
                 if not user:
                     raise LoginFailed("Пользователь не найден")
 
-                # Проверяем пароль
-                if not user.hashed_password or not PasswordHasher.verify(user.hashed_password, password): 
+                if not user.hashed_password or not is_password_valid:
                     raise LoginFailed("Неверный пароль")
 
                 # Проверяем права администратора
-                if not user.role == UserRole.ADMIN:
+                if user.role != ADMIN_ROLE:
                     raise LoginFailed("Недостаточно прав для доступа к админ-панели")
 
+                # Новый ID сессии при входе: ID, выданный до аутентификации,
+                # не должен стать аутентифицированным (session fixation)
+                regenerate_session_id(request)
+
                 # Сохраняем данные в сессии
                 request.session.update({
                     "username": username,
@@ -80,10 +168,17 @@ class CustomAuthProvider(AuthProvider):
                     "is_admin": True
                 })
 
+                # Сразу кешируем администратора, чтобы следующий запрос
+                # к админ-панели не обращался к базе данных
+                await cache_admin_user(redis, username, user)
+
                 return response
 
+            except LoginFailed:
+                raise
             except Exception as e:
-                raise LoginFailed(f"Ошибка аутентификации: {str(e)}")
+                logger.exception("Ошибка аутентификации в админ-панели")
+                raise LoginFailed("Неверные учетные данные") from e
 
     async def is_authenticated(
         self,
@@ -92,31 +187,48 @@ class CustomAuthProvider(AuthProvider):
         """
         Проверяет, аутентифицирован ли пользователь.
 
+        Данные администратора кешируются в Redis на ADMIN_USER_CACHE_TTL
+        секунд, чтобы не обращаться к базе данных на каждый запрос.
+
         Args:
             request (Request): HTTP запрос
 
         Returns:
             bool: True если пользователь аутентифицирован и имеет права админа
         """
-        redis = await get_redis_client()
-        async for session in get_db_session():
-            try:
-                username = request.session.get("username")
-                if not username:
+        username = request.session.get("username")
+        if not username:
+            return False
+
+        try:
+            redis = await get_redis_client()
+
+            # Сначала пробуем взять администратора из кеша
+            cache_key = get_admin_cache_key(username)
+            cached = await redis.get(cache_key)
+            if cached:
+                user = AdminSessionUser(**json.loads(cached))
+                if user.role != ADMIN_ROLE:
                     return False
+                request.state.user = user
+                return True
 
+            session_factory = await database_client.connect()
+            async with session_factory() as session:
                 service = AuthService(session, redis)
-                user = await service.data_manager.get_user_by_identifier(username)
+                db_user = await service.data_manager.get_user_credentials(
+                    username, admin_only=True
+                )
 
-                if user and user.role == UserRole.ADMIN:
-                    # Сохраняем пользователя в состоянии запроса
-                    request.state.user = user
-                    return True
+            if db_user:
+                # Сохраняем пользователя в состоянии запроса
+                request.state.user = await cache_admin_user(redis, username, db_user)
+                return True
 
-                return False
+            return False
 
-            except Exception:
-                return False
+        except Exception:
+            return False
 
     def get_admin_config(self, request: Request) -> AdminConfig:
         """
@@ -157,6 +269,8 @@ class CustomAuthProvider(AuthProvider):
         """
         Обрабатывает выход администратора из системы.
 
+        Очищает сессию и удаляет данные администратора из кеша Redis.
+
         Args:
             request (Request): HTTP запрос
             response (Response): HTTP ответ
@@ -164,5 +278,10 @@ class CustomAuthProvider(AuthProvider):
         Returns:
             Response: HTTP ответ с очищенной сессией
         """
+        username = request.session.get("username")
+        if username:
+            redis = await get_redis_client()
+            await redis.delete(get_admin_cache_key(username))
+
         request.session.clear()
         return response
@@ -12,12 +12,49 @@ Redis используется в приложении как универсал
 базовые интерфейсы из модуля base.py.
 """
 
-from redis import Redis, from_url
+from typing import Optional
+
+from redis.asyncio import ConnectionPool, Redis
 
 from app.core.settings import Config, settings
 
 from .base import BaseClient, BaseContextManager
 
+# Общий пул соединений Redis для всех клиентов приложения
+_pool: Optional[ConnectionPool] = None
+
+
+def get_connection_pool(_settings: Config = settings) -> ConnectionPool:
+    """
+    Возвращает общий пул соединений Redis, создавая его при первом вызове.
+
+    Args:
+        _settings (Config): Конфигурация приложения с параметрами подключения к Redis.
+
+    Returns:
+        ConnectionPool: Пул соединений Redis
+    """
+    global _pool
+    if _pool is None:
+        _pool = ConnectionPool.from_url(
+            **_settings.redis_params,
+            decode_responses=True,
+            health_check_interval=30,
+        )
+    return _pool
+
+
+async def close_connection_pool() -> None:
+    """
+    Закрывает общий пул соединений Redis.
+
+    Вызывается при остановке приложения.
+    """
+    global _pool
+    if _pool is not None:
+        await _pool.disconnect()
+        _pool = None
+
 
 class RedisClient(BaseClient):
     """
@@ -27,7 +64,7 @@ class RedisClient(BaseClient):
     подключением к Redis серверу.
 
     Attributes:
-        _redis_params (dict): Параметры подключения к Redis из конфигурации
+        _settings (Config): Конфигурация с параметрами подключения к Redis
         _client (Optional[Redis]): Экземпляр подключения к Redis
         logger (logging.Logger): Логгер для записи событий подключения
     """
@@ -41,13 +78,13 @@ class RedisClient(BaseClient):
                               По умолчанию использует глобальные настройки приложения.
         """
         super().__init__()
-        self._redis_params = _settings.redis_params
+        self._settings = _settings
 
     async def connect(self) -> Redis:
         """Создает подключение к Redis
 
-        Устанавливает соединение с Redis сервером, используя параметры
-        из конфигурации приложения.
+        Создает клиент Redis поверх общего пула соединений, поэтому
+        новые TCP-соединения открываются только при нехватке свободных.
 
         Returns:
             Redis: Экземпляр подключенного Redis клиента
@@ -56,7 +93,7 @@ class RedisClient(BaseClient):
             RedisError: При ошибке подключения к Redis серверу
         """
         self.logger.debug("Подключение к Redis...")
-        self._client = from_url(**self._redis_params)
+        self._client = Redis(connection_pool=get_connection_pool(self._settings))
         self.logger.info("Подключение к Redis установлено")
         return self._client
 
@@ -64,13 +101,13 @@ class RedisClient(BaseClient):
         """
         Закрывает подключение к Redis
 
-        Корректно завершает соединение с Redis сервером и очищает
-        ссылку на клиент. Безопасно обрабатывает случай, когда
-        подключение уже закрыто.
+        Освобождает клиент и очищает ссылку на него. Общий пул соединений
+        остается открытым и закрывается в close_connection_pool при
+        остановке приложения.
         """
         if self._client:
             self.logger.debug("Закрытие подключения к Redis...")
-            self._client.close()
+            await self._client.aclose()
             self._client = None
             self.logger.info("Подключение к Redis закрыто")
 
@@ -12,7 +12,9 @@
 
 from sqlalchemy.ext.asyncio import (AsyncEngine, AsyncSession,
                                     async_sessionmaker, create_async_engine)
-from typing import cast, Optional, AsyncGenerator
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, cast, Optional
 import asyncio
 
 from app.core.settings import Config, settings
@@ -33,13 +35,17 @@ class DatabaseClient(BaseClient):
         _settings (Config): Конфигурация с параметрами подключения к БД
         _engine (Optional[AsyncEngine]): Глобальный асинхронный движок SQLAlchemy
         _session_factory (Optional[async_sessionmaker]): Глобальная фабрика сессий
-        _lock (asyncio.Lock): Блокировка для thread-safe инициализации
+        _lock (Optional[asyncio.Lock]): Блокировка для безопасной инициализации,
+            создается лениво в текущем event loop
+        _loop (Optional[asyncio.AbstractEventLoop]): Event loop, к которому
+            привязана блокировка
         logger (logging.Logger): Логгер для записи событий
     """
 
     _instance: Optional['DatabaseClient'] = None
     _initialized: bool = False
-    _lock = asyncio.Lock()
+    _lock: Optional[asyncio.Lock] = None
+    _loop: Optional[asyncio.AbstractEventLoop] = None
 
     def __new__(cls, *args, **kwargs) -> 'DatabaseClient':
         """Реализация паттерна Singleton."""
@@ -56,26 +62,56 @@ class DatabaseClient(BaseClient):
         self._session_factory: Optional[async_sessionmaker] = None
         self._initialized = True
 
+    def _ensure_lock(self) -> asyncio.Lock:
+        """
+        Возвращает блокировку, привязанную к текущему event loop.
+
+        Блокировка создается при первом использовании и пересоздается,
+        если клиент используется из другого event loop (например, в другом
+        воркере uvicorn или в тестах).
+
+        Returns:
+            asyncio.Lock: Блокировка для текущего event loop
+        """
+        loop = asyncio.get_running_loop()
+        lock = self._lock
+        if lock is None or self._loop is not loop:
+            lock = asyncio.Lock()
+            DatabaseClient._loop = loop
+            DatabaseClient._lock = lock
+        return lock
+
+    def _get_engine_kwargs(self) -> dict[str, Any]:
+        """
+        Формирует параметры создания движка SQLAlchemy.
+
+        Размеры пула, таймауты и параметры asyncpg берутся из
+        settings.engine_params (переменные окружения DB_*).
+
+        Returns:
+            dict[str, Any]: Параметры для create_async_engine
+        """
+        return {
+            "poolclass": AsyncAdaptedQueuePool,
+            **self._settings.engine_params,
+        }
+
     async def connect(self) -> async_sessionmaker:
         if self._session_factory is not None:
             return self._session_factory
-        async with self._lock:
+        async with self._ensure_lock():
             if self._session_factory is not None:
                 return self._session_factory
             self.logger.debug("Инициализация глобального подключения к базе данных...")
-            self._engine = create_async_engine(
-                url=self._settings.database_url,
-                **self._settings.engine_params
-            )
             self._session_factory = async_sessionmaker(
-                bind=self._engine,
+                bind=self.get_engine(),
                 **self._settings.session_params
             )
             self.logger.info("Глобальное подключение к базе данных установлено")
         return self._session_factory
 
     async def close(self) -> None:
-        async with self._lock:
+        async with self._ensure_lock():
             if self._engine:
                 self.logger.debug("Закрытие глобального подключения к базе данных...")
                 await self._engine.dispose()
@@ -103,19 +139,17 @@ class DatabaseClient(BaseClient):
     def get_engine(self) -> AsyncEngine:
         """
         Получение текущего движка базы данных.
+
+        Движок создается один раз и затем переиспользуется, в том числе
+        в connect(), поэтому админ-панель и сессии приложения работают
+        через один пул соединений.
+
         Returns:
             AsyncEngine: асинхронный движок SQLAlchemy
-        Raises:
-            RuntimeError: если движок еще не инициализирован (connect не вызывался)
         """
-        self._engine = create_async_engine(
-            url=self._settings.database_url, **self._settings.engine_params
-        )
-        
         if self._engine is None:
-            raise RuntimeError(
-                "База данных не инициализирована. "
-                "Вызовите connect() перед использованием."
+            self._engine = create_async_engine(
+                url=self._settings.database_dsn, **self._get_engine_kwargs()
             )
         return self._engine
 
@@ -252,20 +286,24 @@ async def close_database_connection() -> None:
     """
     await db_client.close()
 
-async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
+@asynccontextmanager
+async def get_db_session() -> AsyncIterator[AsyncSession]:
     """
     Утилитарная функция для получения асинхронной сессии базы данных.
 
+    Сессия закрывается и возвращает соединение в пул сразу при выходе
+    из блока async with, в том числе при return или исключении.
+
     Returns:
-        AsyncGenerator[AsyncSession, None]: Асинхронный генератор сессий
+        AsyncIterator[AsyncSession]: Асинхронный контекстный менеджер сессии
 
     Usage:
         ```python
-        async for session in get_db_session():
+        async with get_db_session() as session:
             # Работа с сессией
             pass
         ```
     """
     session_factory = await get_session_factory()
     async with session_factory() as session:
-        yield session
\ No newline at end of file
+        yield session
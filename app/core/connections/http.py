@@ -10,46 +10,102 @@
 """
 
 import json
-from typing import Any, Dict
+import logging
+from typing import Any, Dict, Optional
 
 import aiohttp
+import orjson
 
 from .base import BaseClient, BaseContextManager
 
 
+def format_json(data: Any) -> str:
+    """
+    Форматирует данные в JSON с отступами для логирования.
+
+    Использует orjson, а для типов, которые он не поддерживает,
+    возвращается к стандартному модулю json.
+
+    Args:
+        data (Any): Данные для форматирования
+
+    Returns:
+        str: JSON-строка с отступами
+    """
+    try:
+        return orjson.dumps(
+            data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        ).decode()
+    except TypeError:
+        return json.dumps(data, indent=2, ensure_ascii=False, default=str)
+
+
 class HttpClient(BaseClient):
     """
     HTTP клиент
 
     Реализует базовый класс BaseClient для управления HTTP-сессиями.
-    Предоставляет возможность создания и закрытия HTTP-сессий.
+    Все экземпляры используют одну общую HTTP-сессию с пулом соединений,
+    чтобы не выполнять DNS-запрос, TCP и TLS рукопожатие на каждый запрос.
+    Общая сессия закрывается при остановке приложения.
 
     Attributes:
-        _client (Optional[aiohttp.ClientSession]): Экземпляр HTTP-сессии
+        _shared_session (Optional[aiohttp.ClientSession]): Общая HTTP-сессия
+        _client (Optional[aiohttp.ClientSession]): Ссылка на общую HTTP-сессию
         logger (logging.Logger): Логгер для записи событий
     """
 
+    _shared_session: Optional[aiohttp.ClientSession] = None
+
+    @classmethod
+    def get_shared_session(cls) -> aiohttp.ClientSession:
+        """
+        Возвращает общую HTTP-сессию, создавая ее при необходимости.
+
+        Returns:
+            aiohttp.ClientSession: Общая HTTP-сессия
+        """
+        if cls._shared_session is None or cls._shared_session.closed:
+            cls._shared_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=100,
+                    limit_per_host=20,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=60,
+                )
+            )
+        return cls._shared_session
+
+    @classmethod
+    async def close_shared_session(cls) -> None:
+        """
+        Закрывает общую HTTP-сессию.
+
+        Вызывается при остановке приложения.
+        """
+        if cls._shared_session is not None and not cls._shared_session.closed:
+            await cls._shared_session.close()
+        cls._shared_session = None
+
     async def connect(self) -> aiohttp.ClientSession:
         """
-        Создает HTTP сессию
+        Возвращает общую HTTP сессию
 
         Returns:
-            aiohttp.ClientSession: Новая HTTP-сессия для выполнения запросов
+            aiohttp.ClientSession: HTTP-сессия для выполнения запросов
         """
-        self.logger.debug("Создание HTTP сессии...")
-        self._client = aiohttp.ClientSession()
+        self.logger.debug("Получение HTTP сессии...")
+        self._client = self.get_shared_session()
         return self._client
 
     async def close(self) -> None:
         """
-        Закрывает HTTP сессию
+        Освобождает HTTP сессию
 
-        Безопасно закрывает активную HTTP-сессию, если она существует.
+        Общая HTTP-сессия не закрывается, так как используется другими
+        клиентами. Она закрывается в close_shared_session при остановке.
         """
-        if self._client:
-            self.logger.debug("Закрытие HTTP сессии...")
-            await self._client.close()
-            self._client = None
+        self._client = None
 
 
 class HttpContextManager(BaseContextManager):
@@ -90,17 +146,27 @@ class HttpContextManager(BaseContextManager):
             aiohttp.ClientSession: Настроенная HTTP-сессия
         """
         self._client = await self.http_client.connect()
+
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return self._client
+
         self.logger.debug("%s запрос к %s", self.method, self.url)
 
         # Логируем данные запроса, но не изменяем их
         if data := self.kwargs.get("data"):
-            self.logger.debug("Данные запроса:")
-            formatted_data = json.dumps(data, indent=2, ensure_ascii=False)
-            for line in formatted_data.split("\n"):
-                self.logger.debug("  %s", line)
+            self.logger.debug("Данные запроса:\n%s", format_json(data))
 
         return self._client
 
+    async def close(self) -> None:
+        """
+        Освобождает HTTP-сессию
+
+        Общая HTTP-сессия остается открытой для следующих запросов.
+        """
+        await self.http_client.close()
+        self._client = None
+
     async def execute(self) -> Dict[str, Any]:
         """
         Выполняет HTTP запрос
@@ -116,10 +182,12 @@ class HttpContextManager(BaseContextManager):
             - error: описание ошибки
             - raw_text: исходный текст ответа
         """
+        # Уровень логирования проверяется один раз: все форматирование
+        # для отладочных логов выполняется только внутри блоков is_debug
+        is_debug = self.logger.isEnabledFor(logging.DEBUG)
+
         try:
             # Логируем детали запроса перед отправкой
-            is_debug = self.logger.isEnabledFor(10)  # DEBUG level
-
             if is_debug:
                 self.logger.debug(
                     "Отправка %s запроса на URL: %s", self.method, self.url
@@ -130,16 +198,12 @@ class HttpContextManager(BaseContextManager):
 
                 # Логируем тело запроса с отступами для лучшей читаемости
                 if data := self.kwargs.get("data"):
-                    self.logger.debug("Тело запроса (data):")
-                    formatted_data = json.dumps(data, indent=2, ensure_ascii=False)
-                    for line in formatted_data.split("\n"):
-                        self.logger.debug("  %s", line)
+                    self.logger.debug("Тело запроса (data):\n%s", format_json(data))
 
                 if json_data := self.kwargs.get("json"):
-                    self.logger.debug("Тело запроса (json):")
-                    formatted_json = json.dumps(json_data, indent=2, ensure_ascii=False)
-                    for line in formatted_json.split("\n"):
-                        self.logger.debug("  %s", line)
+                    self.logger.debug(
+                        "Тело запроса (json):\n%s", format_json(json_data)
+                    )
 
             # Выполняем запрос
             async with self._client.request(
@@ -148,42 +212,46 @@ class HttpContextManager(BaseContextManager):
                 # Получаем текст ответа
                 response_text = await response.text()
 
+                # Парсим JSON один раз и используем результат и для логов
+                parsed = None
+                parse_error = None
+                try:
+                    parsed = orjson.loads(response_text)
+                except orjson.JSONDecodeError as e:
+                    parse_error = e
+
                 if is_debug:
                     self.logger.debug("Статус ответа: %s", response.status)
 
-                    # Логируем заголовки ответа
-                    self.logger.debug("Заголовки ответа:")
-                    for header, value in response.headers.items():
-                        self.logger.debug("  %s: %s", header, value)
+                    # Логируем заголовки ответа одной записью
+                    self.logger.debug(
+                        "Заголовки ответа:\n%s",
+                        "\n".join(
+                            f"  {header}: {value}"
+                            for header, value in response.headers.items()
+                        ),
+                    )
 
                     # Логируем тело ответа
-                    self.logger.debug("Тело ответа:")
-                    if response_text:
-                        # Пытаемся форматировать JSON для лучшей читаемости
-                        try:
-                            json_response = json.loads(response_text)
-                            formatted_response = json.dumps(
-                                json_response, indent=2, ensure_ascii=False
-                            )
-                            for line in formatted_response.split("\n"):
-                                self.logger.debug("  %s", line)
-                        except json.JSONDecodeError:
-                            # Если не JSON, выводим как есть
-                            for line in response_text.split("\n"):
-                                self.logger.debug("  %s", line)
+                    if not response_text:
+                        self.logger.debug("Тело ответа: <пустой ответ>")
+                    elif parse_error is None:
+                        # Форматируем JSON для лучшей читаемости
+                        self.logger.debug("Тело ответа:\n%s", format_json(parsed))
                     else:
-                        self.logger.debug("  <пустой ответ>")
+                        # Если не JSON, выводим как есть
+                        self.logger.debug("Тело ответа:\n%s", response_text)
 
-                # Пытаемся распарсить JSON
-                try:
-                    return json.loads(response_text)
-                except json.JSONDecodeError as e:
-                    self.logger.error("Ошибка парсинга JSON: %s", e)
+                if parse_error is not None:
+                    self.logger.error("Ошибка парсинга JSON: %s", parse_error)
                     self.logger.error("Сырой текст ответа: %s", response_text)
                     return {
-                        "error": f"Invalid JSON response: {str(e)}",
+                        "error": f"Invalid JSON response: {str(parse_error)}",
                         "raw_text": response_text,
                     }
+
+                # Тело "null" приводим к пустому словарю, как и объявлено в сигнатуре
+                return parsed if parsed is not None else {}
         except Exception as e:
             self.logger.error("Ошибка при выполнении HTTP запроса: %s", str(e))
             return {"error": f"Error processing response: {str(e)}"}
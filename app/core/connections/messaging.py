@@ -10,7 +10,10 @@
 """
 
 import asyncio
-from typing import Optional
+import logging
+import random
+import time
+from typing import Any, ClassVar, Optional
 
 from aio_pika import connect_robust
 from aio_pika.abc import AbstractRobustConnection
@@ -20,80 +23,160 @@ from app.core.settings import settings
 
 from .base import BaseClient
 
+logger = logging.getLogger(__name__)
+
+# Параметры подключения вычисляются один раз при импорте модуля
+_CONNECTION_PARAMS = {
+    **settings.rabbitmq_params,
+    # Зависшее TCP-подключение быстро уходит в цикл повторных попыток
+    "timeout": settings.RABBITMQ_CONNECT_TIMEOUT,
+    "client_properties": {"connection_name": settings.TITLE},
+}
+
 
 class RabbitMQClient(BaseClient):
     """
-    Клиент для работы с RabbitMQ
+    Singleton клиент для работы с RabbitMQ
 
     Реализует базовый класс BaseClient для установки и управления
     подключением к брокеру сообщений RabbitMQ с механизмом повторных попыток.
+    Все экземпляры класса используют одно подключение: параллельные вызовы
+    connect() ожидают одно рукопожатие AMQP.
 
     Attributes:
+        _client_instance (Optional[RabbitMQClient]): Единственный экземпляр класса
+        _initialized (bool): Флаг инициализации
         _instance (Optional[AbstractRobustConnection]): Экземпляр подключения к RabbitMQ
         _is_connected (bool): Флаг состояния подключения
+        _healthy (bool): Флаг работоспособности подключения, обновляется
+            обработчиками закрытия и переподключения
+        _last_probe (float): Время последней прямой проверки подключения
+        _probe_interval (float): Интервал прямой проверки подключения в секундах
+        _lock (Optional[asyncio.Lock]): Блокировка подключения, создается лениво
+            в текущем event loop
+        _loop (Optional[asyncio.AbstractEventLoop]): Event loop, к которому
+            привязана блокировка
         _max_retries (int): Максимальное количество попыток подключения
-        _retry_delay (int): Задержка между попытками подключения в секундах
+        _retry_delay (float): Базовая задержка между попытками подключения в секундах
+        _retry_max_delay (float): Максимальная задержка между попытками в секундах
         _connection_params (dict): Параметры подключения из настроек
-        _debug_mode (bool): Режим отладки из настроек приложения
-        logger (logging.Logger): Логгер для записи событий
     """
 
-    _instance: Optional[AbstractRobustConnection] = None
-    _is_connected: bool = False
+    _client_instance: ClassVar[Optional["RabbitMQClient"]] = None
+    _initialized: bool = False
+    _instance: ClassVar[Optional[AbstractRobustConnection]] = None
+    _is_connected: ClassVar[bool] = False
+    _lock: ClassVar[Optional[asyncio.Lock]] = None
+    _loop: ClassVar[Optional[asyncio.AbstractEventLoop]] = None
+    _healthy: ClassVar[bool] = False
+    _last_probe: ClassVar[float] = 0.0
+    _probe_interval: float = 30
     _max_retries: int = 5
-    _retry_delay: int = 5
+    _retry_delay: float = 0.5
+    _retry_max_delay: float = 30
+
+    def __new__(cls, *args, **kwargs) -> "RabbitMQClient":
+        """Реализация паттерна Singleton."""
+        if cls._client_instance is None:
+            cls._client_instance = super().__new__(cls)
+        return cls._client_instance
 
     def __init__(self) -> None:
         """
         Инициализация клиента RabbitMQ.
-        Настраивает параметры подключения и режим отладки из конфигурации.
+        Настраивает параметры подключения из конфигурации.
         """
+        if self._initialized:
+            return
         super().__init__()
-        self._connection_params = settings.rabbitmq_params
-        self._debug_mode = getattr(settings, "DEBUG", False)
+        self._connection_params = _CONNECTION_PARAMS
+        self._max_retries = settings.RABBITMQ_MAX_RETRIES
+        self._retry_delay = settings.RABBITMQ_RETRY_DELAY
+        self._retry_max_delay = settings.RABBITMQ_RETRY_MAX_DELAY
+        self._initialized = True
+
+    def _ensure_lock(self) -> asyncio.Lock:
+        """
+        Возвращает блокировку подключения для текущего event loop.
+
+        Returns:
+            asyncio.Lock: Блокировка для текущего event loop
+        """
+        cls = type(self)
+        loop = asyncio.get_running_loop()
+        if cls._lock is None or cls._loop is not loop:
+            cls._loop = loop
+            cls._lock = asyncio.Lock()
+        return cls._lock
+
+    def _get_retry_delay(self, attempt: int) -> float:
+        """
+        Вычисляет задержку перед повторной попыткой подключения.
+
+        Использует экспоненциальный рост задержки с ограничением сверху
+        и случайным разбросом, чтобы воркеры не переподключались синхронно.
+
+        Args:
+            attempt (int): Номер неудачной попытки, начиная с 0
+
+        Returns:
+            float: Задержка в секундах
+        """
+        delay = min(self._retry_delay * (2**attempt), self._retry_max_delay)
+        return delay * (0.5 + random.random())
 
     async def connect(self) -> Optional[AbstractRobustConnection]:
         """
         Создает подключение к RabbitMQ
 
         Устанавливает подключение к брокеру сообщений с механизмом повторных попыток.
-        В режиме отладки при неудачном подключении возвращает None вместо исключения.
+        Если все попытки исчерпаны, возвращает None, чтобы приложение могло
+        продолжить работу без брокера.
 
         Returns:
             Optional[AbstractRobustConnection]: Подключение к RabbitMQ или None в случае неудачи
-
-        Raises:
-            AMQPConnectionError: При ошибке подключения (только в production режиме)
         """
-        if not self._instance and not self._is_connected:
+        cls = type(self)
+        if cls._instance is not None and cls._is_connected:
+            return cls._instance
+
+        async with self._ensure_lock():
+            # Другой вызов мог установить подключение, пока мы ждали блокировку
+            if cls._instance is not None and cls._is_connected:
+                return cls._instance
+
             for attempt in range(self._max_retries):
                 try:
-                    self.logger.debug("Подключение к RabbitMQ...")
-                    self._instance = await connect_robust(**self._connection_params)
-                    self._is_connected = True
-                    self.logger.info("Подключение к RabbitMQ установлено")
+                    logger.debug("Подключение к RabbitMQ...")
+                    cls._instance = await connect_robust(**self._connection_params)
+                    cls._instance.close_callbacks.add(self._on_closed)
+                    cls._instance.reconnect_callbacks.add(self._on_reconnected)
+                    cls._is_connected = True
+                    cls._healthy = True
+                    cls._last_probe = time.monotonic()
+                    logger.info("Подключение к RabbitMQ установлено")
                     break
-                except AMQPConnectionError as e:
-                    self.logger.error("Ошибка подключения к RabbitMQ: %s", str(e))
+                except (AMQPConnectionError, asyncio.TimeoutError, OSError) as e:
+                    # Таймаут подключения (RABBITMQ_CONNECT_TIMEOUT) повторяется
+                    # так же, как отказ в соединении
+                    logger.error("Ошибка подключения к RabbitMQ: %s", str(e))
                     if attempt < self._max_retries - 1:
-                        self.logger.warning(
-                            f"Повторная попытка {attempt+1}/{self._max_retries} через {self._retry_delay} секунд..."
+                        delay = self._get_retry_delay(attempt)
+                        logger.warning(
+                            "Повторная попытка %s/%s через %.1f секунд...",
+                            attempt + 1,
+                            self._max_retries,
+                            delay,
                         )
-                        await asyncio.sleep(self._retry_delay)
+                        await asyncio.sleep(delay)
                     else:
-                        self._is_connected = False
-                        self._instance = None
-                        self.logger.warning(
+                        cls._is_connected = False
+                        cls._instance = None
+                        logger.warning(
                             "RabbitMQ недоступен после всех попыток, но приложение продолжит работу"
                         )
-
-                        # В режиме разработки не выбрасываем исключение, просто возвращаем None
-                        if self._debug_mode:
-                            return None
-                        else:
-                            # raise
-                            return None
-        return self._instance
+                        return None
+        return cls._instance
 
     async def close(self) -> None:
         """
@@ -101,14 +184,40 @@ class RabbitMQClient(BaseClient):
 
         Безопасно закрывает активное подключение к брокеру сообщений.
         """
-        if self._instance and self._is_connected:
-            try:
-                self.logger.debug("Закрытие подключения к RabbitMQ...")
-                await self._instance.close()
-                self.logger.info("Подключение к RabbitMQ закрыто")
-            finally:
-                self._instance = None
-                self._is_connected = False
+        cls = type(self)
+        async with self._ensure_lock():
+            if cls._instance and cls._is_connected:
+                try:
+                    logger.debug("Закрытие подключения к RabbitMQ...")
+                    await cls._instance.close()
+                    logger.info("Подключение к RabbitMQ закрыто")
+                finally:
+                    cls._instance = None
+                    cls._is_connected = False
+                    cls._healthy = False
+
+    @classmethod
+    def _on_closed(cls, sender: Any, exc: Optional[BaseException] = None) -> None:
+        """
+        Обработчик закрытия подключения.
+
+        Args:
+            sender (Any): Подключение, вызвавшее обработчик
+            exc (Optional[BaseException]): Причина закрытия подключения
+        """
+        cls._healthy = False
+        logger.warning("Подключение к RabbitMQ потеряно: %s", exc)
+
+    @classmethod
+    def _on_reconnected(cls, sender: Any) -> None:
+        """
+        Обработчик восстановления подключения.
+
+        Args:
+            sender (Any): Подключение, вызвавшее обработчик
+        """
+        cls._healthy = True
+        logger.info("Подключение к RabbitMQ восстановлено")
 
     async def health_check(self) -> bool:
         """
@@ -117,13 +226,20 @@ class RabbitMQClient(BaseClient):
         Returns:
             bool: True если подключение активно и работает, False в противном случае
         """
-        if not self._instance or not self._is_connected:
-            return False
-        try:
-            return not self._instance.is_closed
-        except AMQPConnectionError:
+        cls = type(self)
+        if not cls._instance or not cls._is_connected:
             return False
 
+        # Состояние поддерживается обработчиками подключения; флаг is_closed
+        # перечитывается не чаще интервала со случайным разбросом
+        now = time.monotonic()
+        interval = self._probe_interval * (0.5 + random.random())
+        if now - cls._last_probe >= interval:
+            cls._last_probe = now
+            cls._healthy = not cls._instance.is_closed
+
+        return cls._healthy
+
     @property
     def is_connected(self) -> bool:
         """
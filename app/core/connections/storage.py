@@ -9,7 +9,9 @@
 базовые интерфейсы из модуля base.py.
 """
 
-from typing import Any
+import logging
+from contextlib import AsyncExitStack
+from typing import Any, Optional
 
 from aioboto3 import Session
 from botocore.config import Config as BotocoreConfig
@@ -20,6 +22,32 @@ from app.core.settings import settings
 
 from .base import BaseClient, BaseContextManager
 
+logger = logging.getLogger(__name__)
+
+# Общая сессия AWS: создание сессии загружает модели сервисов botocore
+# и учетные данные, поэтому она создается один раз на процесс
+_session: Optional[Session] = None
+
+
+def get_session(settings: AppConfig = settings) -> Session:
+    """
+    Возвращает общую сессию AWS, создавая ее при первом вызове.
+
+    Args:
+        settings (AppConfig): Конфигурация приложения с параметрами подключения к S3.
+
+    Returns:
+        Session: Сессия aioboto3
+    """
+    global _session
+    if _session is None:
+        _session = Session(
+            aws_access_key_id=settings.AWS_ACCESS_KEY_ID.get_secret_value(),
+            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY.get_secret_value(),
+            region_name=settings.AWS_REGION,
+        )
+    return _session
+
 
 class S3Client(BaseClient):
     """
@@ -33,7 +61,6 @@ class S3Client(BaseClient):
         session (Session | None): Сессия AWS для работы с S3
         client (Any | None): Клиент S3
         client_context (Any | None): Контекст клиента S3
-        logger (logging.Logger): Логгер для записи событий подключения
     """
 
     def __init__(self, settings: AppConfig = settings) -> None:
@@ -48,40 +75,49 @@ class S3Client(BaseClient):
         self.settings = settings
         self.session = None
         self.client = None
+        self.client_context = None
 
     async def connect(self) -> Any:
         """Создает клиент S3
 
-        Устанавливает соединение с S3-совместимым хранилищем, используя параметры
-        из конфигурации приложения.
+        Создает контекст клиента S3 из общей сессии AWS, используя параметры
+        из конфигурации приложения, и входит в него. Контекст закрывается
+        в close().
 
         Returns:
-            Any: Контекст клиента S3 для выполнения операций с хранилищем
+            Any: Клиент S3 для выполнения операций с хранилищем
 
         Raises:
             ClientError: При ошибке подключения к S3
         """
-        s3_config = BotocoreConfig(s3={"addressing_style": "virtual"})
+        s3_config = BotocoreConfig(
+            s3={"addressing_style": "virtual"},
+            max_pool_connections=self.settings.AWS_MAX_POOL_CONNECTIONS,
+            retries={
+                "mode": "standard",
+                "max_attempts": self.settings.AWS_MAX_ATTEMPTS,
+            },
+            connect_timeout=self.settings.AWS_CONNECT_TIMEOUT,
+            read_timeout=self.settings.AWS_READ_TIMEOUT,
+            tcp_keepalive=True,
+        )
         try:
-            self.logger.debug("Создание клиента S3...")
-            self.session = Session(
-                aws_access_key_id=self.settings.AWS_ACCESS_KEY_ID.get_secret_value(),
-                aws_secret_access_key=self.settings.AWS_SECRET_ACCESS_KEY.get_secret_value(),
-                region_name=self.settings.AWS_REGION,
-            )
+            logger.debug("Создание клиента S3...")
+            self.session = get_session(self.settings)
             client_context = self.session.client(
                 service_name=self.settings.AWS_SERVICE_NAME,
                 endpoint_url=self.settings.AWS_ENDPOINT,
                 config=s3_config,
             )
+            self.client = await client_context.__aenter__()
             self.client_context = client_context
-            self.logger.info("Клиент S3 успешно создан")
-            return client_context
+            logger.info("Клиент S3 успешно создан")
+            return self.client
         except ClientError as e:
             error_details = (
                 e.response["Error"] if hasattr(e, "response") else "Нет деталей"
             )
-            self.logger.error(
+            logger.error(
                 "Ошибка создания S3 клиента: %s\nДетали: %s", e, error_details
             )
             raise
@@ -90,13 +126,17 @@ class S3Client(BaseClient):
         """
         Закрывает клиент S3
 
-        Освобождает ресурсы, связанные с клиентом S3.
+        Выходит из контекста клиента aioboto3 и закрывает его пул соединений.
         Безопасно обрабатывает случай, когда клиент уже закрыт.
         """
-        if self.client:
-            self.logger.debug("Закрытие клиента S3...")
-            self.client = None
-            self.logger.info("Клиент S3 закрыт")
+        if self.client_context is not None:
+            logger.debug("Закрытие клиента S3...")
+            try:
+                await self.client_context.__aexit__(None, None, None)
+            finally:
+                self.client_context = None
+                self.client = None
+            logger.info("Клиент S3 закрыт")
 
 
 class S3ContextManager(BaseContextManager):
@@ -110,6 +150,7 @@ class S3ContextManager(BaseContextManager):
         s3_client (S3Client): Клиент S3 для управления подключением
         client (Any | None): Активный клиент S3
         client_context (Any | None): Контекст клиента S3
+        _stack (Optional[AsyncExitStack]): Стек освобождения ресурсов контекста
         logger (logging.Logger): Логгер для записи событий
     """
 
@@ -122,17 +163,23 @@ class S3ContextManager(BaseContextManager):
         self.s3_client = S3Client()
         self.client = None
         self.client_context = None
+        self._stack: Optional[AsyncExitStack] = None
 
     async def __aenter__(self):
         """
         Асинхронный вход в контекст.
 
+        Закрытие S3Client регистрируется в AsyncExitStack, поэтому ресурсы
+        освобождаются даже при ошибке создания клиента.
+
         Returns:
             Any: Активный клиент S3 для работы с хранилищем
         """
-        self.client_context = await self.s3_client.connect()
-
-        self.client = await self.client_context.__aenter__()
+        async with AsyncExitStack() as stack:
+            stack.push_async_callback(self.s3_client.close)
+            self.client = await self.s3_client.connect()
+            self.client_context = self.s3_client.client_context
+            self._stack = stack.pop_all()
         return self.client
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -144,16 +191,16 @@ class S3ContextManager(BaseContextManager):
             exc_val: Экземпляр исключения, если оно произошло
             exc_tb: Трейсбек исключения, если оно произошло
         """
-        if self.client_context:
-            await self.client_context.__aexit__(exc_type, exc_val, exc_tb)
-        await self.s3_client.close()
+        if self._stack is not None:
+            stack, self._stack = self._stack, None
+            await stack.__aexit__(exc_type, exc_val, exc_tb)
 
     async def connect(self) -> Any:
         """
         Устанавливает подключение к S3.
 
         Returns:
-            Any: Контекст клиента S3
+            Any: Клиент S3
         """
         return await self.s3_client.connect()
 
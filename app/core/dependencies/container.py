@@ -2,23 +2,42 @@
 Модуль содержит контейнер зависимостей.
 """
 
-from dishka import make_async_container
+from functools import cache
+
+from dishka import AsyncContainer, make_async_container
 from dishka.integrations.fastapi import FastapiProvider
 
 from .providers.admin import AdminProvider
-from .providers.cache import RedisMiddlewareProvider, RedisProvider
+from .providers.cache import RedisProvider
 from .providers.database import DatabaseProvider
+from .providers.header import HeaderProvider
 from .providers.messaging import RabbitMQProvider
 from .providers.storage import S3Provider
 
-
-container = make_async_container(
-
+# Провайдеры приложения, создаются один раз при импорте модуля
+PROVIDERS = (
     AdminProvider(),
     FastapiProvider(),
     DatabaseProvider(),
+    HeaderProvider(),
     RabbitMQProvider(),
     RedisProvider(),
-    RedisMiddlewareProvider(),
     S3Provider(),
 )
+
+
+@cache
+def get_container() -> AsyncContainer:
+    """
+    Возвращает контейнер зависимостей приложения.
+
+    Контейнер создается один раз на процесс; повторные вызовы возвращают
+    тот же экземпляр. Закрывается в обработчике остановки приложения.
+
+    Returns:
+        AsyncContainer: Асинхронный контейнер dishka
+    """
+    return make_async_container(*PROVIDERS)
+
+
+container = get_container()
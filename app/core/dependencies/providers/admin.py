@@ -1,10 +1,10 @@
 from dishka import Provider, Scope, provide
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import async_sessionmaker
 
 from app.services.v1.admin.service import AdminInitService
 
 
 class AdminProvider(Provider):
-    @provide(scope=Scope.REQUEST)
-    def admin_init_service(self, db_session: AsyncSession) -> AdminInitService:
-        return AdminInitService(db_session)
+    @provide(scope=Scope.APP)
+    def admin_init_service(self, session_factory: async_sessionmaker) -> AdminInitService:
+        return AdminInitService(session_factory)
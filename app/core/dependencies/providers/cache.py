@@ -1,24 +1,25 @@
 from typing import AsyncGenerator
 
 from dishka import Provider, Scope, provide
-from redis import Redis
+from redis.asyncio import ConnectionPool, Redis
 
-from app.core.connections.cache import RedisClient
+from app.core.connections.cache import get_connection_pool
 
 
 class RedisProvider(Provider):
-    @provide(scope=Scope.REQUEST)
-    async def get_client(self) -> AsyncGenerator[Redis, None]:
-        client = RedisClient()
-        redis = await client.connect()
-        yield redis
-        await client.close()
-
-
-class RedisMiddlewareProvider(Provider):
     @provide(scope=Scope.APP)
-    async def get_middleware_client(self) -> Redis:
-        client = RedisClient()
-        redis = await client.connect()
-        # Не закрываем соединение, т.к. оно должно жить все время работы приложения
-        return redis
+    def get_pool(self) -> ConnectionPool:
+        # Пул закрывается в close_connection_pool при остановке приложения.
+        # Потребители уровня приложения (middleware) получают пул и создают
+        # клиент Redis(connection_pool=pool) без отдельного подключения
+        return get_connection_pool()
+
+    @provide(scope=Scope.REQUEST)
+    async def get_client(self, pool: ConnectionPool) -> AsyncGenerator[Redis, None]:
+        # Клиент берет соединения из общего пула и не открывает новые сокеты
+        client = Redis(connection_pool=pool)
+        try:
+            yield client
+        finally:
+            # Возвращает соединение в пул, сам пул остается открытым
+            await client.aclose()
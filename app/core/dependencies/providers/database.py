@@ -1,13 +1,21 @@
 from typing import AsyncGenerator
 
 from dishka import Provider, Scope, provide
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from app.core.connections.database import DatabaseContextManager
+from app.core.connections.database import database_client
 
 
 class DatabaseProvider(Provider):
+    @provide(scope=Scope.APP)
+    async def get_session_factory(self) -> async_sessionmaker:
+        # Движок и фабрика сессий создаются один раз и закрываются
+        # при остановке приложения в обработчике close_database_connection
+        return await database_client.connect()
+
     @provide(scope=Scope.REQUEST)
-    async def get_session(self) -> AsyncGenerator[AsyncSession, None]:
-        async with DatabaseContextManager() as session:
+    async def get_session(
+        self, session_factory: async_sessionmaker
+    ) -> AsyncGenerator[AsyncSession, None]:
+        async with session_factory() as session:
             yield session
@@ -0,0 +1,13 @@
+from dishka import Provider, Scope, provide
+from redis.asyncio import Redis
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.services.v1.header.service import HeaderService
+
+
+class HeaderProvider(Provider):
+    @provide(scope=Scope.REQUEST)
+    def header_service(
+        self, session_factory: async_sessionmaker, redis: Redis
+    ) -> HeaderService:
+        return HeaderService(session_factory, redis)
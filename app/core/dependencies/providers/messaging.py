@@ -1,15 +1,28 @@
 from typing import AsyncGenerator
 
-from aio_pika import Connection
+from aio_pika.abc import AbstractChannel, AbstractRobustConnection
+from aio_pika.exceptions import AMQPConnectionError
 from dishka import Provider, Scope, provide
 
-from app.core.connections.messaging import RabbitMQClient
-
 
 class RabbitMQProvider(Provider):
-    @provide(scope=Scope.REQUEST)
-    async def get_client(self) -> AsyncGenerator[Connection, None]:
+    @provide(scope=Scope.APP)
+    async def get_connection(self) -> AsyncGenerator[AbstractRobustConnection, None]:
+        from app.core.connections.messaging import RabbitMQClient
+
         client = RabbitMQClient()
         connection = await client.connect()
+        if connection is None:
+            # Исключение не дает dishka закешировать None на время жизни
+            # приложения: следующий запрос снова попробует подключиться
+            raise AMQPConnectionError("RabbitMQ недоступен после всех попыток подключения")
         yield connection
+        # Подключение закрывается только при закрытии контейнера приложения
         await client.close()
+
+    @provide(scope=Scope.REQUEST)
+    async def get_channel(
+        self, connection: AbstractRobustConnection
+    ) -> AsyncGenerator[AbstractChannel, None]:
+        async with connection.channel(publisher_confirms=True) as channel:
+            yield channel
@@ -3,11 +3,14 @@ from typing import AsyncGenerator
 from botocore.client import BaseClient
 from dishka import Provider, Scope, provide
 
-from app.core.connections.storage import S3ContextManager
-
 
 class S3Provider(Provider):
-    @provide(scope=Scope.REQUEST)
+    @provide(scope=Scope.APP)
     async def get_client(self) -> AsyncGenerator[BaseClient, None]:
+        # aioboto3 импортируется только при первом обращении к S3
+        from app.core.connections.storage import S3ContextManager
+
+        # Клиент живет все время работы приложения, чтобы пул HTTP-соединений
+        # botocore переиспользовался между запросами
         async with S3ContextManager() as client:
             yield client
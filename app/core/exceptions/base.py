@@ -9,15 +9,48 @@
 """
 
 import logging
-import uuid
-from datetime import datetime
+import secrets
+from contextvars import ContextVar
+from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, Optional
 
-import pytz
 from fastapi import HTTPException
 
 logger = logging.getLogger(__name__)
-moscow_tz = pytz.timezone("Europe/Moscow")
+
+# Московское время (UTC+3, без перехода на летнее время с 2014 года).
+# Фиксированное смещение не требует таблицы часовых поясов.
+MSK_TZ = timezone(timedelta(hours=3), "MSK")
+
+
+def generate_request_id() -> str:
+    """
+    Генерирует идентификатор запроса для ответа с ошибкой.
+
+    Берется из системного источника случайности, поэтому идентификаторы
+    не повторяются между воркерами, созданными через fork.
+
+    Returns:
+        str: 128-битный идентификатор в виде 32 шестнадцатеричных символов
+    """
+    return secrets.token_hex(16)
+
+
+request_id_var: ContextVar[Optional[str]] = ContextVar("request_id", default=None)
+"""Идентификатор текущего запроса, устанавливается RequestIDMiddleware."""
+
+
+def get_request_id() -> str:
+    """
+    Возвращает идентификатор текущего запроса.
+
+    Берет идентификатор, установленный middleware на входе запроса,
+    и генерирует новый только вне контекста запроса.
+
+    Returns:
+        str: Идентификатор запроса
+    """
+    return request_id_var.get() or generate_request_id()
 
 
 class BaseAPIException(HTTPException):
@@ -49,8 +82,8 @@ class BaseAPIException(HTTPException):
         self.extra = extra or {}  # Сохраняем extra
 
         context = {
-            "timestamp": datetime.now(moscow_tz).isoformat(),
-            "request_id": str(uuid.uuid4()),
+            "timestamp": datetime.now(MSK_TZ).isoformat(),
+            "request_id": get_request_id(),
             "status_code": status_code,
             "error_type": error_type,
             **(extra or {}),
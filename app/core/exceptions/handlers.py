@@ -15,22 +15,135 @@
 соответствующий HTTP-код состояния и содержимое ответа.
 """
 
-import uuid
+import time
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict, Optional
+from decimal import Decimal
+from operator import itemgetter
+from types import MappingProxyType
+from typing import Any, Awaitable, Callable, Dict, Mapping, Optional, Tuple, Type, Union
 
-import pytz
+import orjson
 from fastapi import FastAPI, Request, status
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
+from pydantic import BaseModel
 from starlette.exceptions import HTTPException
+from starlette.responses import Response
 from starlette.websockets import WebSocketDisconnect
 
-from app.core.exceptions.base import BaseAPIException
+from app.core.exceptions.base import (
+    MSK_TZ,
+    BaseAPIException,
+    get_request_id,
+)
 from app.core.exceptions.auth import AuthenticationError
 
-# Московская временная зона для временных меток
-moscow_tz = pytz.timezone("Europe/Moscow")
+# Сообщения об ошибках для обработчиков, не связанных с BaseAPIException
+VALIDATION_ERROR_DETAIL = "Ошибка валидации данных"
+WEBSOCKET_ERROR_DETAIL = "Ошибка WebSocket соединения"
+AUTH_ERROR_DETAIL = "Ошибка авторизации"
+INTERNAL_ERROR_DETAIL = "Внутренняя ошибка сервера"
+
+# Извлекает из ошибки валидации только поля, которые попадают в ответ
+_get_loc_and_msg = itemgetter("loc", "msg")
+
+# Дополнительные заголовки ответа в зависимости от HTTP-кода
+STATUS_HEADERS: Mapping[int, Mapping[str, str]] = MappingProxyType(
+    {status.HTTP_401_UNAUTHORIZED: MappingProxyType({"WWW-Authenticate": "Bearer"})}
+)
+
+# Последняя сформированная временная метка: (секунда Unix-времени, ISO-строка)
+_timestamp_cache: Tuple[int, str] = (0, "")
+
+
+@dataclass(slots=True)
+class ErrorDetail:
+    """
+    Информация об ошибке во вложенном формате ответа.
+
+    Attributes:
+        detail: Подробное описание ошибки
+        error_type: Тип ошибки для идентификации на клиенте
+        status_code: HTTP код состояния
+        timestamp: Временная метка ошибки
+        request_id: Идентификатор запроса
+        extra: Дополнительные данные об ошибке
+    """
+
+    detail: str
+    error_type: str
+    status_code: int
+    timestamp: str
+    request_id: str
+    extra: Optional[Dict[str, Any]]
+
+
+@dataclass(slots=True)
+class ErrorEnvelope:
+    """
+    Вложенный формат ответа с ошибкой (поля BaseResponseSchema).
+
+    orjson сериализует dataclass напрямую, без промежуточного словаря.
+
+    Attributes:
+        success: Всегда False для ответа с ошибкой
+        message: Сообщение ответа (для ошибок не используется)
+        data: Данные ответа (для ошибок не используются)
+        error: Информация об ошибке
+    """
+
+    success: bool = False
+    message: Optional[str] = None
+    data: Any = None
+    error: Optional[ErrorDetail] = None
+
+
+def orjson_default(obj: Any) -> Any:
+    """
+    Сериализует типы, которые orjson не поддерживает нативно.
+
+    datetime, UUID и dataclass orjson обрабатывает сам; эта функция нужна
+    для данных из extra: Pydantic-моделей, множеств и Decimal.
+
+    Args:
+        obj: Объект, который не удалось сериализовать
+
+    Returns:
+        Any: Представление объекта, поддерживаемое orjson
+
+    Raises:
+        TypeError: Если тип объекта не поддерживается
+    """
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if isinstance(obj, Decimal):
+        return str(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def get_error_timestamp() -> str:
+    """
+    Возвращает временную метку для ответа с ошибкой.
+
+    Строка кешируется с точностью до секунды: при потоке ошибок
+    (например, массовые ошибки валидации) datetime создается и форматируется
+    не чаще одного раза в секунду.
+
+    Returns:
+        str: Текущее московское время в формате ISO 8601 без долей секунды
+    """
+    global _timestamp_cache
+
+    now = int(time.time())
+    cached = _timestamp_cache
+    if cached[0] == now:
+        return cached[1]
+
+    timestamp = datetime.fromtimestamp(now, MSK_TZ).isoformat()
+    _timestamp_cache = (now, timestamp)
+    return timestamp
 
 
 def create_error_response(
@@ -40,7 +153,7 @@ def create_error_response(
     request_id: Optional[str] = None,
     extra: Optional[Dict[str, Any]] = None,
     flat_structure: bool = False,  # Новый параметр для выбора структуры
-) -> JSONResponse:
+) -> Response:
     """
     Создает стандартизированный JSON-ответ с информацией об ошибке.
 
@@ -51,58 +164,57 @@ def create_error_response(
         status_code: HTTP код состояния
         detail: Подробное описание ошибки
         error_type: Тип ошибки для идентификации на клиенте
-        request_id: Уникальный идентификатор запроса (генерируется, если не указан)
+        request_id: Уникальный идентификатор запроса (по умолчанию - идентификатор
+            текущего запроса из request_id_var)
         extra: Дополнительные данные об ошибке
         flat_structure: Если True, возвращает плоскую структуру JSON для лучшей совместимости
 
     Returns:
-        JSONResponse: HTTP-ответ со стандартизированной структурой
+        Response: HTTP-ответ со стандартизированной структурой, тело которого
+            заранее сериализовано через orjson
     """
     if request_id is None:
-        request_id = str(uuid.uuid4())
-
-    timestamp = datetime.now(moscow_tz).isoformat()
+        request_id = get_request_id()
 
-    # Для Swagger UI проверяем, если это запрос от Swagger
-    headers = {}
+    timestamp = get_error_timestamp()
 
-    # Для запросов с Authorization: Bearer добавляем заголовок WWW-Authenticate
-    if status_code == 401:
-        headers["WWW-Authenticate"] = "Bearer"
+    # Для 401 добавляется WWW-Authenticate, для остальных кодов заголовков нет
+    headers = STATUS_HEADERS.get(status_code)
 
     # Выбор структуры ответа в зависимости от параметра flat_structure
+    content: Union[Dict[str, Any], ErrorEnvelope]
     if flat_structure:
         # Плоская структура для лучшей совместимости со Swagger UI
+        # Дополнительные поля из extra добавляются на верхний уровень
         content = {
             "detail": detail,
             "error_type": error_type,
             "status_code": status_code,
             "timestamp": timestamp,
             "request_id": request_id,
-            "error": extra,
+            **(extra or {}),
         }
-
-        # Добавляем дополнительные поля из extra, если они есть
-        if extra:
-            for key, value in extra.items():
-                content[key] = value
     else:
         # Вложенная структура для стандартного формата API
-        content = {
-            "success": False,
-            "message": None,
-            "data": None,
-            "error": {
-                "detail": detail,
-                "error_type": error_type,
-                "status_code": status_code,
-                "timestamp": timestamp,
-                "request_id": request_id,
-                "extra": extra,
-            },
-        }
-
-    return JSONResponse(status_code=status_code, content=content, headers=headers)
+        content = ErrorEnvelope(
+            error=ErrorDetail(
+                detail=detail,
+                error_type=error_type,
+                status_code=status_code,
+                timestamp=timestamp,
+                request_id=request_id,
+                extra=extra,
+            )
+        )
+
+    return Response(
+        content=orjson.dumps(
+            content, default=orjson_default, option=orjson.OPT_NON_STR_KEYS
+        ),
+        status_code=status_code,
+        media_type="application/json",
+        headers=headers,
+    )
 
 
 async def api_exception_handler(_request: Request, exc: BaseAPIException):
@@ -117,16 +229,16 @@ async def api_exception_handler(_request: Request, exc: BaseAPIException):
         exc (BaseAPIException): Исключение, наследующееся от BaseAPIException
 
     Returns:
-        JSONResponse: HTTP-ответ с кодом состояния из исключения и структурированным JSON-телом
+        Response: HTTP-ответ с кодом состояния из исключения и структурированным JSON-телом
     """
-    request_id = exc.extra.get("request_id", None)
+    extra = exc.extra
 
     return create_error_response(
         status_code=exc.status_code,
         detail=exc.detail,
         error_type=exc.error_type,
-        request_id=request_id,
-        extra=exc.extra,
+        request_id=extra.get("request_id"),
+        extra=extra,
     )
 
 
@@ -142,7 +254,7 @@ async def http_exception_handler(_request: Request, exc: HTTPException):
         exc (HTTPException): Стандартное HTTP-исключение
 
     Returns:
-        JSONResponse: HTTP-ответ с кодом состояния из исключения и структурированным JSON-телом
+        Response: HTTP-ответ с кодом состояния из исключения и структурированным JSON-телом
     """
     return create_error_response(
         status_code=exc.status_code, detail=str(exc.detail), error_type="http_error"
@@ -161,14 +273,16 @@ async def validation_exception_handler(_request: Request, exc: RequestValidation
         exc (RequestValidationError): Исключение валидации Pydantic
 
     Returns:
-        JSONResponse: HTTP-ответ с кодом 422 и структурированным JSON-телом,
+        Response: HTTP-ответ с кодом 422 и структурированным JSON-телом,
                      содержащим список всех ошибок валидации
     """
-    errors = [{"loc": err["loc"], "msg": err["msg"]} for err in exc.errors()]
+    errors = [
+        {"loc": loc, "msg": msg} for loc, msg in map(_get_loc_and_msg, exc.errors())
+    ]
 
     return create_error_response(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-        detail="Ошибка валидации данных",
+        detail=VALIDATION_ERROR_DETAIL,
         error_type="validation_error",
         extra={"errors": errors},
     )
@@ -186,12 +300,12 @@ async def websocket_exception_handler(_request: Request, exc: Exception):
         exc (Exception): Исключение, возникшее в WebSocket-обработчике
 
     Returns:
-        JSONResponse: HTTP-ответ с кодом 500 и структурированным JSON-телом
+        Response: HTTP-ответ с кодом 500 и структурированным JSON-телом
                      с информацией об ошибке WebSocket
     """
     return create_error_response(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        detail="Ошибка WebSocket соединения",
+        detail=WEBSOCKET_ERROR_DETAIL,
         error_type="websocket_error",
         extra={"error": str(exc)},
     )
@@ -209,12 +323,12 @@ async def auth_exception_handler(_request: Request, exc: Exception):
         exc (Exception): Исключение аутентификации/авторизации
 
     Returns:
-        JSONResponse: HTTP-ответ с кодом 401 и структурированным JSON-телом
+        Response: HTTP-ответ с кодом 401 и структурированным JSON-телом
                      с информацией об ошибке авторизации
     """
     return create_error_response(
         status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Ошибка авторизации",
+        detail=AUTH_ERROR_DETAIL,
         error_type="auth_error",
         extra={"error": str(exc)},
         flat_structure=True,
@@ -235,17 +349,32 @@ async def internal_exception_handler(_request: Request, exc: Exception):
         exc (Exception): Любое необработанное исключение
 
     Returns:
-        JSONResponse: HTTP-ответ с кодом 500 и структурированным JSON-телом
+        Response: HTTP-ответ с кодом 500 и структурированным JSON-телом
                      с общей информацией о внутренней ошибке сервера
     """
     return create_error_response(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        detail="Внутренняя ошибка сервера",
+        detail=INTERNAL_ERROR_DETAIL,
         error_type="internal_error",
         extra={"error": str(exc)},
     )
 
 
+EXCEPTION_HANDLERS: Mapping[Type[Exception], Callable[..., Awaitable[Response]]] = (
+    MappingProxyType(
+        {
+            BaseAPIException: api_exception_handler,
+            HTTPException: http_exception_handler,
+            RequestValidationError: validation_exception_handler,
+            WebSocketDisconnect: websocket_exception_handler,
+            AuthenticationError: auth_exception_handler,
+            Exception: internal_exception_handler,
+        }
+    )
+)
+"""Соответствие типов исключений и их обработчиков (только для чтения)."""
+
+
 def register_exception_handlers(app: FastAPI) -> None:
     """
     Регистрация обработчиков исключений в FastAPI-приложении.
@@ -255,9 +384,5 @@ def register_exception_handlers(app: FastAPI) -> None:
     Args:
         app (FastAPI): Экземпляр FastAPI-приложения, в котором будут регистрироваться обработчики.
     """
-    app.add_exception_handler(BaseAPIException, api_exception_handler)
-    app.add_exception_handler(HTTPException, http_exception_handler)
-    app.add_exception_handler(RequestValidationError, validation_exception_handler)
-    app.add_exception_handler(WebSocketDisconnect, websocket_exception_handler)
-    app.add_exception_handler(AuthenticationError, auth_exception_handler)
-    app.add_exception_handler(Exception, internal_exception_handler)
+    for exc_class, handler in EXCEPTION_HANDLERS.items():
+        app.add_exception_handler(exc_class, handler)
@@ -1,7 +1,7 @@
 import logging
-from typing import List, Optional
+from typing import Any, Awaitable, List, Optional, Set, cast
 
-from redis import Redis
+from redis.asyncio import Redis
 
 
 class BaseRedisDataManager:
@@ -37,7 +37,7 @@ class BaseRedisDataManager:
         Returns:
             None
         """
-        self.redis.set(key, value, ex=expires)
+        await self.redis.set(key, value, ex=expires)
 
     async def get(self, key: str) -> Optional[str]:
         """
@@ -57,8 +57,7 @@ class BaseRedisDataManager:
             >>> redis_storage.get('non_existent_key')
             None
         """
-        result = self.redis.get(key)
-        return result.decode() if result else None
+        return await self.redis.get(key)
 
     async def delete(self, key: str) -> None:
         """
@@ -79,7 +78,7 @@ class BaseRedisDataManager:
             >>> redis_storage.get('my_key')
             None
         """
-        self.redis.delete(key)
+        await self.redis.delete(key)
 
     async def sadd(self, key: str, value: str) -> None:
         """
@@ -98,7 +97,8 @@ class BaseRedisDataManager:
             >>> redis_storage.sadd('my_set', 'value2')
             >>> redis_storage.sadd('my_set', 'value3')
         """
-        self.redis.sadd(key, value)
+        # В аннотациях redis-py команды множеств возвращают "Awaitable[T] | T"
+        await cast(Awaitable[int], self.redis.sadd(key, value))
 
     async def srem(self, key: str, value: str) -> None:
         """
@@ -120,9 +120,9 @@ class BaseRedisDataManager:
         >>> redis_storage.smembers('my_set')
         ['value1', 'value3']
         """
-        self.redis.srem(key, value)
+        await cast(Awaitable[int], self.redis.srem(key, value))
 
-    async def keys(self, pattern: str) -> List[bytes]:
+    async def keys(self, pattern: str) -> List[str]:
         """
         Получает ключи по паттерну
 
@@ -130,7 +130,7 @@ class BaseRedisDataManager:
             pattern: Паттерн для поиска ключей
 
         Returns:
-            List[bytes]: Список ключей
+            List[str]: Список ключей
 
         Usage:
             >>> redis_storage.set('key1', 'value1')
@@ -139,7 +139,7 @@ class BaseRedisDataManager:
             >>> redis_storage.keys('key*')
             ['key1', 'key2', 'key3']
         """
-        return self.redis.keys(pattern)
+        return await self.redis.keys(pattern)
 
     async def smembers(self, key: str) -> List[str]:
         """
@@ -158,8 +158,8 @@ class BaseRedisDataManager:
             >>> redis_storage.smembers('my_set')
             ['value1', 'value2', 'value3']
         """
-        result = self.redis.smembers(key)
-        return [member.decode() for member in result] if result else []
+        result = await cast(Awaitable[Set[Any]], self.redis.smembers(key))
+        return list(result) if result else []
 
     async def sismember(self, key: str, value: str) -> bool:
         """
@@ -180,7 +180,7 @@ class BaseRedisDataManager:
             >>> redis_storage.sismember('my_set', 'value2')
             False
         """
-        return bool(self.redis.sismember(key, value))
+        return bool(await cast(Awaitable[int], self.redis.sismember(key, value)))
 
     async def set_expire(self, key: str, seconds: int) -> None:
         """
@@ -198,4 +198,4 @@ class BaseRedisDataManager:
             >>> redis_storage.set('my_key', 'my_value')
             >>> redis_storage.set_expire('my_key', 60)  # Ключ будет удален через 60 секунд
         """
-        self.redis.expire(key, seconds)
\ No newline at end of file
+        await self.redis.expire(key, seconds)
\ No newline at end of file
@@ -1,4 +1,8 @@
-from app.core.lifespan.base import lifespan
+from app.core.lifespan.base import (
+    lifespan,
+    register_shutdown_handler,
+    register_startup_handler,
+)
 
-# Экспортируем только lifespan для использования в main.py
-__all__ = ["lifespan"]
+# Единая точка импорта: реестры обработчиков существуют в одном экземпляре
+__all__ = ["lifespan", "register_shutdown_handler", "register_startup_handler"]
@@ -8,7 +8,8 @@ import logging
 
 from fastapi import FastAPI
 
-from app.core.lifespan.base import register_startup_handler
+from app.core.lifespan import register_startup_handler
+from app.core.lifespan.database import initialize_database
 from app.core.dependencies.container import container
 from app.core.settings import settings
 from app.services.v1.admin.service import AdminInitService
@@ -16,7 +17,7 @@ from app.services.v1.admin.service import AdminInitService
 logger = logging.getLogger("app.lifecycle.admin")
 
 
-@register_startup_handler
+@register_startup_handler(depends_on=(initialize_database,))
 async def initialize_admin(app: FastAPI) -> None:
     """
     Инициализация администратора при старте приложения.
@@ -39,10 +40,9 @@ async def initialize_admin(app: FastAPI) -> None:
         logger.error("ADMIN_PASSWORD не указан в настройках")
         return
 
-    async with container() as request_container:
-        admin_service = await request_container.get(AdminInitService)
-        await admin_service.initialize_admin(
-            admin_email=admin_email,
-            password=settings.ADMIN_PASSWORD.get_secret_value()
-        )
+    admin_service = await container.get(AdminInitService)
+    await admin_service.initialize_admin(
+        admin_email=admin_email,
+        password=settings.ADMIN_PASSWORD.get_secret_value()
+    )
 
@@ -31,9 +31,11 @@ Usage:
     ```
 """
 
+import asyncio
+import importlib
 import logging
 from contextlib import asynccontextmanager
-from typing import Awaitable, Callable, List
+from typing import Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
 
 from fastapi import FastAPI
 
@@ -46,23 +48,70 @@ StartupHandler = Callable[[FastAPI], Awaitable[None]]
 ShutdownHandler = Callable[[FastAPI], Awaitable[None]]
 """Тип функции-обработчика события остановки приложения."""
 
-# Списки обработчиков
-startup_handlers: List[StartupHandler] = []
+# Реестры обработчиков (ключ - полное имя функции, порядок - порядок регистрации)
+startup_handlers: Dict[str, StartupHandler] = {}
 """Глобальный реестр обработчиков запуска приложения."""
 
-shutdown_handlers: List[ShutdownHandler] = []
+shutdown_handlers: Dict[str, ShutdownHandler] = {}
 """Глобальный реестр обработчиков остановки приложения."""
 
+startup_dependencies: Dict[str, Tuple[str, ...]] = {}
+"""Зависимости обработчиков запуска: ключ обработчика -> ключи обработчиков,
+которые должны завершиться до его запуска."""
 
-def register_startup_handler(handler: StartupHandler):
+HANDLER_MODULES = (
+    "app.core.lifespan.database",
+    "app.core.lifespan.clients",
+    "app.core.lifespan.admin",
+)
+"""
+Модули с обработчиками жизненного цикла в порядке их регистрации.
+
+Импортируются при старте приложения, а не на уровне модуля, так как сами
+импортируют настройки, которые, в свою очередь, зависят от этого модуля.
+"""
+
+
+def _get_handler_key(handler: Callable) -> str:
+    """
+    Формирует ключ обработчика в реестре.
+
+    Args:
+        handler: Функция-обработчик
+
+    Returns:
+        str: Полное имя функции вида module.qualname
+    """
+    return f"{handler.__module__}.{handler.__qualname__}"
+
+
+def load_handler_modules() -> None:
+    """
+    Импортирует модули с обработчиками, регистрируя их через декораторы.
+
+    Повторный импорт модуля берется из sys.modules, а повторная регистрация
+    обработчика игнорируется, поэтому функцию безопасно вызывать несколько раз.
+    """
+    for module_name in HANDLER_MODULES:
+        importlib.import_module(module_name)
+
+
+def register_startup_handler(
+    handler: Optional[StartupHandler] = None,
+    *,
+    depends_on: Sequence[StartupHandler] = (),
+):
     """
     Декоратор для регистрации обработчика события запуска приложения.
 
     Автоматически добавляет функцию в глобальный реестр обработчиков запуска.
-    Обработчики выполняются в порядке регистрации при старте приложения.
+    Обработчики без зависимостей друг от друга выполняются параллельно,
+    обработчик с depends_on запускается только после завершения своих
+    зависимостей.
 
     Args:
         handler: Асинхронная функция-обработчик, принимающая экземпляр FastAPI
+        depends_on: Обработчики, которые должны завершиться до запуска этого
 
     Returns:
         StartupHandler: Исходная функция-обработчик (для возможности цепочки декораторов)
@@ -74,10 +123,23 @@ def register_startup_handler(handler: StartupHandler):
             # Инициализация базы данных
             await database.connect()
             app.state.database = database
+
+        @register_startup_handler(depends_on=(initialize_database,))
+        async def initialize_admin(app: FastAPI):
+            # Использует уже подключенную базу данных
+            ...
         ```
     """
-    startup_handlers.append(handler)
-    return handler
+
+    def decorator(func: StartupHandler) -> StartupHandler:
+        key = _get_handler_key(func)
+        startup_handlers.setdefault(key, func)
+        startup_dependencies[key] = tuple(_get_handler_key(dep) for dep in depends_on)
+        return func
+
+    if handler is None:
+        return decorator
+    return decorator(handler)
 
 
 def register_shutdown_handler(handler: ShutdownHandler):
@@ -85,7 +147,7 @@ def register_shutdown_handler(handler: ShutdownHandler):
     Декоратор для регистрации обработчика события остановки приложения.
 
     Автоматически добавляет функцию в глобальный реестр обработчиков остановки.
-    Обработчики выполняются в порядке регистрации при остановке приложения.
+    Обработчики выполняются в порядке, обратном регистрации (как и HANDLER_MODULES).
 
     Args:
         handler: Асинхронная функция-обработчик, принимающая экземпляр FastAPI
@@ -102,7 +164,7 @@ def register_shutdown_handler(handler: ShutdownHandler):
                 await app.state.database.close()
         ```
     """
-    shutdown_handlers.append(handler)
+    shutdown_handlers.setdefault(_get_handler_key(handler), handler)
     return handler
 
 
@@ -110,8 +172,8 @@ async def run_startup_handlers(app: FastAPI):
     """
     Выполняет все зарегистрированные обработчики запуска приложения.
 
-    Автоматически импортирует и регистрирует обработчики из известных модулей,
-    затем последовательно выполняет все зарегистрированные обработчики.
+    Импортирует модули из HANDLER_MODULES (регистрируя их обработчики),
+    затем выполняет все зарегистрированные обработчики по фазам.
     При возникновении ошибки в любом обработчике, она логируется, но выполнение
     продолжается для остальных обработчиков.
 
@@ -119,8 +181,8 @@ async def run_startup_handlers(app: FastAPI):
         app: Экземпляр FastAPI приложения
 
     Note:
-        Обработчики выполняются в порядке их регистрации. Если порядок выполнения
-        критичен, убедитесь, что модули импортируются в правильной последовательности.
+        Независимые обработчики выполняются параллельно. Если обработчику нужен
+        результат другого, укажите его в depends_on при регистрации.
 
     Example:
         ```python
@@ -128,34 +190,75 @@ async def run_startup_handlers(app: FastAPI):
         await run_startup_handlers(app)
         ```
     """
+    load_handler_modules()
 
-    from app.core.lifespan.clients import initialize_clients
-    from app.core.lifespan.database import initialize_database
-    from app.core.lifespan.admin import initialize_admin
-
-    if initialize_admin not in startup_handlers:
-        startup_handlers.append(initialize_admin)
-    # Добавляем обработчики если их нет (защита от дублирования)
-    if initialize_database not in startup_handlers:
-        startup_handlers.append(initialize_database)
-    if initialize_clients not in startup_handlers:
-        startup_handlers.append(initialize_clients)
-    # Выполняем все зарегистрированные обработчики
-    for handler in startup_handlers:
-        try:
-            logger.info("Запуск обработчика: %s", handler.__name__)
-            await handler(app)
+    # Выполняем обработчики по фазам, внутри фазы - параллельно
+    for phase in get_startup_phases():
+        await asyncio.gather(*(_run_startup_handler(handler, app) for handler in phase))
+
+
+def get_startup_phases() -> List[List[StartupHandler]]:
+    """
+    Разбивает обработчики запуска на фазы по их зависимостям.
+
+    В каждую фазу попадают обработчики, все зависимости которых выполнены
+    в предыдущих фазах. Зависимости, отсутствующие в реестре, игнорируются.
+    При циклической зависимости оставшиеся обработчики выполняются
+    последовательно в порядке регистрации.
+
+    Returns:
+        List[List[StartupHandler]]: Фазы обработчиков в порядке выполнения
+    """
+    pending = list(startup_handlers)
+    done: set = set()
+    phases: List[List[StartupHandler]] = []
+
+    while pending:
+        ready = [
+            key
+            for key in pending
+            if all(
+                dep in done or dep not in startup_handlers
+                for dep in startup_dependencies.get(key, ())
+            )
+        ]
+        if not ready:
+            logger.error(
+                "Циклическая зависимость обработчиков запуска: %s", ", ".join(pending)
+            )
+            phases.extend([startup_handlers[key]] for key in pending)
+            break
+
+        phases.append([startup_handlers[key] for key in ready])
+        done.update(ready)
+        pending = [key for key in pending if key not in done]
+
+    return phases
+
+
+async def _run_startup_handler(handler: StartupHandler, app: FastAPI) -> None:
+    """
+    Выполняет один обработчик запуска с логированием ошибок.
+
+    Args:
+        handler: Обработчик запуска
+        app: Экземпляр FastAPI приложения
+    """
+    try:
+        logger.info("Запуск обработчика: %s", handler.__name__)
+        await handler(app)
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("Обработчик %s выполнен успешно", handler.__name__)
-        except Exception as e:
-            logger.error("Ошибка в обработчике %s: %s", handler.__name__, str(e))
-            # Продолжаем выполнение остальных обработчиков
+    except Exception:
+        logger.exception("Ошибка в обработчике %s", handler.__name__)
+        # Продолжаем выполнение остальных обработчиков
 
 
 async def run_shutdown_handlers(app: FastAPI):
     """
     Выполняет все зарегистрированные обработчики остановки приложения.
 
-    Автоматически импортирует и регистрирует обработчики из известных модулей,
+    Импортирует модули из HANDLER_MODULES (регистрируя их обработчики),
     затем последовательно выполняет все зарегистрированные обработчики.
     При возникновении ошибки в любом обработчике, она логируется, но выполнение
     продолжается для остальных обработчиков.
@@ -164,9 +267,8 @@ async def run_shutdown_handlers(app: FastAPI):
         app: Экземпляр FastAPI приложения
 
     Note:
-        Обработчики выполняются в порядке их регистрации. Рекомендуется
-        регистрировать обработчики закрытия в обратном порядке относительно
-        обработчиков инициализации.
+        Обработчики выполняются в порядке, обратном регистрации: ресурсы,
+        инициализированные последними, освобождаются первыми.
 
     Example:
         ```python
@@ -174,25 +276,19 @@ async def run_shutdown_handlers(app: FastAPI):
         await run_shutdown_handlers(app)
         ```
     """
-    from app.core.lifespan.clients import close_clients
-    from app.core.lifespan.database import close_database_connection
+    load_handler_modules()
 
-    # Добавляем обработчики если их нет (защита от дублирования)
-    if close_database_connection not in shutdown_handlers:
-        shutdown_handlers.append(close_database_connection)
-    if close_clients not in shutdown_handlers:
-        shutdown_handlers.append(close_clients)
-
-    # Выполняем все зарегистрированные обработчики
-    for handler in shutdown_handlers:
+    # Выполняем обработчики в обратном порядке относительно инициализации
+    for handler in reversed(shutdown_handlers.values()):
         try:
             logger.info("Запуск обработчика остановки: %s", handler.__name__)
             await handler(app)
-            logger.debug("Обработчик остановки %s выполнен успешно", handler.__name__)
-        except Exception as e:
-            logger.error(
-                "Ошибка в обработчике остановки %s: %s", handler.__name__, str(e)
-            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Обработчик остановки %s выполнен успешно", handler.__name__
+                )
+        except Exception:
+            logger.exception("Ошибка в обработчике остановки %s", handler.__name__)
             # Продолжаем выполнение остальных обработчиков
 
 
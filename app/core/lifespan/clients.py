@@ -3,8 +3,7 @@ from typing import List
 from fastapi import FastAPI
 
 from app.core.connections.base import BaseClient
-from app.core.lifespan.base import (register_shutdown_handler,
-                                    register_startup_handler)
+from app.core.lifespan import register_shutdown_handler, register_startup_handler
 
 
 class ClientsManager(BaseClient):
@@ -30,9 +29,16 @@ class ClientsManager(BaseClient):
 
     async def close(self) -> None:
         """Закрывает все клиенты"""
+        from app.core.connections.cache import close_connection_pool
+        from app.core.connections.http import HttpClient
+
         for client in self.clients:
             await client.close()
 
+        # Закрываем общие пулы соединений
+        await HttpClient.close_shared_session()
+        await close_connection_pool()
+
         self.logger.info("Закрыто %s клиентов", len(self.clients))
 
 
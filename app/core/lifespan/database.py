@@ -1,9 +1,6 @@
 from fastapi import FastAPI
 from app.core.connections.database import database_client
-from app.core.lifespan.base import (
-    register_shutdown_handler,
-    register_startup_handler,
-)
+from app.core.lifespan import register_shutdown_handler, register_startup_handler
 
 @register_startup_handler
 async def initialize_database(app: FastAPI):
@@ -7,6 +7,7 @@ Middleware для защиты доступа к документации API.
 - Валидацию логина/пароля из конфига
 """
 
+import secrets
 import time
 
 from fastapi import HTTPException, Request, Response
@@ -36,6 +37,9 @@ class DocsAuthMiddleware(BaseHTTPMiddleware):
     def __init__(self, app):
         super().__init__(app)
         self.auth_cache = {}
+        # Учетные данные извлекаются из SecretStr один раз при создании middleware
+        self._username = settings.DOCS_USERNAME.encode()
+        self._password = settings.DOCS_PASSWORD.get_secret_value().encode()
 
     async def dispatch(self, request: Request, call_next) -> Response:
         if request.url.path in ["/docs", "/redoc", "/openapi.json"]:
@@ -61,10 +65,14 @@ class DocsAuthMiddleware(BaseHTTPMiddleware):
 
             try:
                 auth: HTTPBasicCredentials = await security(request)
-                if (
-                    auth.username == settings.DOCS_USERNAME
-                    and auth.password == settings.DOCS_PASSWORD.get_secret_value()
-                ):
+                # Сравнение за постоянное время, чтобы не раскрывать пароль по таймингу
+                is_username_valid = secrets.compare_digest(
+                    auth.username.encode(), self._username
+                )
+                is_password_valid = secrets.compare_digest(
+                    auth.password.encode(), self._password
+                )
+                if is_username_valid and is_password_valid:
                     # Сохраняем успешную авторизацию в кэш
                     self.auth_cache[client_ip] = {"timestamp": current_time}
                     return await call_next(request)
@@ -0,0 +1,54 @@
+"""
+Middleware для сквозного идентификатора запроса.
+
+Обеспечивает:
+- Прием идентификатора из заголовка X-Request-ID или генерацию нового
+- Сохранение идентификатора в request_id_var для обработчиков исключений и логов
+- Возврат идентификатора клиенту в заголовке ответа
+
+Usage:
+    app = FastAPI()
+    app.add_middleware(RequestIDMiddleware)
+"""
+
+from fastapi import Request, Response
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from app.core.exceptions.base import generate_request_id, request_id_var
+
+REQUEST_ID_HEADER = "X-Request-ID"
+
+# Ограничение длины идентификатора, пришедшего от клиента
+MAX_REQUEST_ID_LENGTH = 128
+
+
+class RequestIDMiddleware(BaseHTTPMiddleware):
+    """
+    Middleware, назначающий каждому запросу идентификатор.
+
+    Идентификатор генерируется один раз на входе запроса, поэтому
+    обработчики ошибок берут его из контекста, а не создают заново.
+    """
+
+    async def dispatch(self, request: Request, call_next) -> Response:
+        """
+        Устанавливает идентификатор запроса и добавляет его в ответ.
+
+        Args:
+            request: Request - запрос
+            call_next: callable - функция для вызова следующего мидлвари
+
+        Returns:
+            response: Response - ответ с заголовком X-Request-ID
+        """
+        request_id = request.headers.get(REQUEST_ID_HEADER)
+        if not request_id or len(request_id) > MAX_REQUEST_ID_LENGTH:
+            request_id = generate_request_id()
+
+        # Каждый запрос обрабатывается в своей задаче asyncio,
+        # поэтому значение не переходит в другие запросы
+        request_id_var.set(request_id)
+
+        response = await call_next(request)
+        response.headers[REQUEST_ID_HEADER] = request_id
+        return response
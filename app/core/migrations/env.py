@@ -18,7 +18,7 @@ section = config.config_ini_section
 # Для быстрых миграций без запуска бд, но сначала alembic upgrade head
 # SQLALCHEMY_DATABASE_URL = "sqlite+aiosqlite:///./test.db"
 # config.set_section_option(section, "sqlalchemy.url", SQLALCHEMY_DATABASE_URL)
-config.set_section_option(section, "sqlalchemy.url", str(settings.database_dsn))
+config.set_section_option(section, "sqlalchemy.url", settings.database_dsn)
 
 # Interpret the config file for Python logging.
 # This line sets up loggers basically.
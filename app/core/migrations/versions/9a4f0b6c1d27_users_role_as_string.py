@@ -0,0 +1,46 @@
+"""users_role_as_string
+
+Revision ID: 9a4f0b6c1d27
+Revises: 3c9d1e7a52b4
+Create Date: 2026-10-15 12:20:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9a4f0b6c1d27'
+down_revision: Union[str, None] = '3c9d1e7a52b4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # ENUM userrole хранил имена (USER/ADMIN), строковая колонка - значения (user/admin)
+    op.alter_column(
+        'users',
+        'role',
+        type_=sa.String(length=16),
+        existing_nullable=False,
+        postgresql_using='lower(role::text)',
+    )
+    op.execute('DROP TYPE IF EXISTS userrole')
+    op.create_check_constraint('ck_users_role', 'users', "role IN ('user', 'admin')")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint('ck_users_role', 'users', type_='check')
+    userrole = sa.Enum('USER', 'ADMIN', name='userrole')
+    userrole.create(op.get_bind(), checkfirst=True)
+    op.alter_column(
+        'users',
+        'role',
+        type_=userrole,
+        existing_nullable=False,
+        postgresql_using='upper(role)::userrole',
+    )
@@ -0,0 +1,48 @@
+"""contact_type_index_active_logo
+
+Revision ID: c7e2a9d4f318
+Revises: 9a4f0b6c1d27
+Create Date: 2026-10-15 12:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7e2a9d4f318'
+down_revision: Union[str, None] = '9a4f0b6c1d27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_contact_info_type', 'contact_info', ['type'], unique=False)
+
+    # Логотипы по умолчанию неактивны (новые тоже: активный может быть
+    # только один). Активным становится последний, который раньше и
+    # отдавался как текущий
+    op.add_column(
+        'logo',
+        sa.Column('is_active', sa.Boolean(), server_default=sa.text('false'), nullable=False),
+    )
+    op.execute(
+        'UPDATE logo SET is_active = true WHERE id = (SELECT max(id) FROM logo)'
+    )
+    op.create_index(
+        'uq_logo_is_active',
+        'logo',
+        ['is_active'],
+        unique=True,
+        postgresql_where=sa.text('is_active'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('uq_logo_is_active', table_name='logo', postgresql_where=sa.text('is_active'))
+    op.drop_column('logo', 'is_active')
+    op.drop_index('ix_contact_info_type', table_name='contact_info')
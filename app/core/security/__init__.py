@@ -8,6 +8,32 @@ Example:
     >>> hashed_password = PasswordHasher.hash_password("secretpassword")
 """
 
-from .password import PasswordHasher
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .password import PasswordHasher
 
 __all__ = ["PasswordHasher"]
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Лениво импортирует PasswordHasher при первом обращении (PEP 562).
+
+    Модуль password инициализирует passlib/argon2 при импорте, поэтому
+    импорт пакета безопасности не должен тянуть его без необходимости.
+
+    Args:
+        name: Имя запрашиваемого атрибута
+
+    Returns:
+        Any: Запрошенный атрибут
+
+    Raises:
+        AttributeError: Если атрибут не найден в пакете
+    """
+    if name == "PasswordHasher":
+        from .password import PasswordHasher
+
+        return PasswordHasher
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
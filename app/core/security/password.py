@@ -18,6 +18,7 @@
 - Это исключение содержит детальное описание всех проблем с паролем
 """
 
+import asyncio
 import logging
 import re
 
@@ -37,6 +38,14 @@ pwd_context = CryptContext(
 
 logger = logging.getLogger(__name__)
 
+# Фиктивный хеш с теми же параметрами Argon2, что и pwd_context.
+# Используется, когда пользователь не найден, чтобы проверка пароля
+# занимала столько же времени, сколько и для существующего пользователя.
+DUMMY_PASSWORD_HASH = (
+    "$argon2id$v=19$m=102400,t=2,p=8"
+    "$jfGeU4qR8v6/NyYkxDiH0A$E9MycB9Mp5pQ1OzhnH59ryXCoou8WNhAoqLwQEhvRko"
+)
+
 
 class PasswordHasher:
     """
@@ -69,6 +78,10 @@ class PasswordHasher:
 
         Returns:
             True, если пароль соответствует хешу, иначе False.
+
+        Note:
+            Сравнение выполняется argon2-cffi за постоянное время,
+            поэтому длительность проверки не зависит от совпадения хешей.
         """
         try:
             return pwd_context.verify(plain_password, hashed_password)
@@ -76,6 +89,39 @@ class PasswordHasher:
             logger.warning("Неизвестный формат хеша пароля")
             return False
 
+    @staticmethod
+    async def hash_password_async(password: str) -> str:
+        """
+        Хеширует пароль в пуле потоков, не блокируя event loop.
+
+        Argon2 занимает процессор на десятки миллисекунд; argon2-cffi
+        отпускает GIL на время вычисления, поэтому в отдельном потоке
+        остальные запросы продолжают обрабатываться.
+
+        Args:
+            password: Пароль для хеширования
+
+        Returns:
+            Хешированный пароль
+        """
+        return await asyncio.to_thread(PasswordHasher.hash_password, password)
+
+    @staticmethod
+    async def verify_async(hashed_password: str, plain_password: str) -> bool:
+        """
+        Проверяет пароль в пуле потоков, не блокируя event loop.
+
+        Args:
+            hashed_password: Хеш пароля.
+            plain_password: Пароль для проверки.
+
+        Returns:
+            True, если пароль соответствует хешу, иначе False.
+        """
+        return await asyncio.to_thread(
+            PasswordHasher.verify, hashed_password, plain_password
+        )
+
 
 class BasePasswordValidator(BaseModel):
     """
@@ -13,10 +13,13 @@ class Config(Settings):
         Settings.__init__(self, **kwargs)
 
 
-@lru_cache
+@lru_cache(maxsize=1)
 def get_config() -> Config:
     """
     Получение конфигурации приложения из кэша.
+
+    Конфигурация создается один раз на процесс; все модули используют
+    общий экземпляр settings, а не создают Settings() повторно.
     """
     config_instance = Config()
 
@@ -25,4 +28,4 @@ def get_config() -> Config:
 
 settings = get_config()
 
-__all__ = ["settings"]
+__all__ = ["settings", "get_config"]
@@ -0,0 +1,42 @@
+from pydantic import SecretStr
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+from app.core.settings.paths import PathSettings
+
+env_file_path, _ = PathSettings.get_env_file_and_type()
+
+
+class YandexSettings(BaseSettings):
+    """
+    Конфигурация Yandex GPT.
+
+    Читает те же переменные окружения YANDEX_*, что и раньше, но создается
+    лениво через Settings.yandex: процессы, которым Yandex GPT не нужен
+    (alembic, CLI), не требуют YANDEX_API_KEY и YANDEX_FOLDER_ID.
+    """
+
+    PRE_INSTRUCTIONS: str = "Ты ассистент, помогающий пользователю."
+    TEMPERATURE: float = 0.6
+    MAX_TOKENS: int = 2000
+    MODEL_NAME: str = "llama"
+    MODEL_VERSION: str = "rc"
+    API_URL: str = "https://llm.api.cloud.yandex.net/foundationModels/v1/completion"
+    API_KEY: SecretStr
+    FOLDER_ID: SecretStr
+
+    @property
+    def model_uri(self) -> str:
+        """
+        Формирует URI модели Yandex GPT.
+
+        Returns:
+            str: URI в формате gpt://{folder_id}/{model_name}/{model_version}
+        """
+        return f"gpt://{self.FOLDER_ID.get_secret_value()}/{self.MODEL_NAME}/{self.MODEL_VERSION}"
+
+    model_config = SettingsConfigDict(
+        env_prefix="YANDEX_",
+        env_file=env_file_path,
+        env_file_encoding="utf-8",
+        extra="ignore",
+    )
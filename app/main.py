@@ -14,8 +14,11 @@ import uvicorn
 from dishka.integrations.fastapi import setup_dishka
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from starlette.middleware.sessions import SessionMiddleware
+from redis.asyncio import Redis
+from starsessions import SessionAutoloadMiddleware, SessionMiddleware
+from starsessions.stores.redis import RedisStore
 from admin import admin
+from app.core.connections.cache import get_connection_pool
 from app.core.dependencies.container import container
 from app.core.exceptions.handlers import register_exception_handlers
 
@@ -23,6 +26,7 @@ from app.core.logging import setup_logging
 
 from app.core.middlewares.docs_auth import DocsAuthMiddleware
 from app.core.middlewares.logging import LoggingMiddleware
+from app.core.middlewares.request_id import RequestIDMiddleware
 
 from app.core.settings import settings
 from app.routes.main import MainRouter
@@ -37,9 +41,19 @@ def create_application() -> FastAPI:
     setup_dishka(container=container, app=app)
 
     register_exception_handlers(app=app)
-    app.add_middleware(SessionMiddleware, secret_key=settings.TOKEN_SECRET_KEY)
+    # Сессии админ-панели хранятся в Redis, в cookie передается только id
+    session_store = RedisStore(
+        connection=Redis(connection_pool=get_connection_pool()),
+        prefix=settings.ADMIN_SESSION_PREFIX,
+        gc_ttl=settings.ADMIN_SESSION_LIFETIME,
+    )
+    app.add_middleware(SessionAutoloadMiddleware, paths=["/admin"])
+    app.add_middleware(
+        SessionMiddleware, store=session_store, **settings.admin_session_params
+    )
     app.add_middleware(LoggingMiddleware)
     app.add_middleware(DocsAuthMiddleware)
+    app.add_middleware(RequestIDMiddleware)
     app.add_middleware(CORSMiddleware, **settings.cors_params)
 
     app.include_router(MainRouter().get_router())
@@ -7,19 +7,31 @@
 Модуль обеспечивает удобную работу с моделями данных и их преобразование в различные форматы.
 """
 
-from datetime import datetime, timezone
-from typing import Any, Dict, List, Type, TypeVar, Union, Set
+from datetime import datetime
+from typing import Any, ClassVar, Dict, List, Set, Tuple, Type, TypeVar, Union
 
-from sqlalchemy import DateTime, MetaData
+from sqlalchemy import DateTime, MetaData, func
+from sqlalchemy.ext.asyncio import AsyncAttrs
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
 T = TypeVar("T", bound="BaseModel")
 
-class BaseModel(DeclarativeBase):
+# Единые имена ограничений и индексов для всех моделей и миграций Alembic
+NAMING_CONVENTION = {
+    "ix": "ix_%(column_0_label)s",
+    "uq": "uq_%(table_name)s_%(column_0_name)s",
+    "ck": "ck_%(table_name)s_%(constraint_name)s",
+    "fk": "fk_%(table_name)s_%(column_0_name)s_%(referred_table_name)s",
+    "pk": "pk_%(table_name)s",
+}
+
+class BaseModel(AsyncAttrs, DeclarativeBase):
     """
     Базовый класс, используемый для определения моделей.
 
     Предоставляет общие поля и методы для работы с моделями.
+    Связи загружаются в async-коде через awaitable_attrs
+    (например, await item.awaitable_attrs.children).
 
     Args:
         id (Mapped[int]): Первичный ключ модели.
@@ -40,15 +52,34 @@ class BaseModel(DeclarativeBase):
     id: Mapped[int] = mapped_column(primary_key=True)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
     )
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(timezone.utc),
-        onupdate=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
+        onupdate=func.now(),
     )
 
-    metadata = MetaData()
+    # Значения, вычисленные на стороне БД, сразу возвращаются через RETURNING,
+    # чтобы обращение к ним не требовало ленивой загрузки в async-сессии
+    __mapper_args__ = {"eager_defaults": True}
+
+    metadata = MetaData(naming_convention=NAMING_CONVENTION)
+
+    _field_names: ClassVar[Tuple[str, ...]] = ()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """
+        Кеширует имена колонок таблицы при объявлении модели.
+
+        Маппинг выполняется в super().__init_subclass__, после него у
+        конкретной модели уже есть __table__, и список колонок можно
+        вычислить один раз вместо обхода маппера на каждый вызов.
+        """
+        super().__init_subclass__(**kwargs)
+        table = getattr(cls, "__table__", None)
+        if table is not None:
+            cls._field_names = tuple(table.columns.keys())
 
     @classmethod
     def table_name(cls) -> str:
@@ -68,7 +99,7 @@ class BaseModel(DeclarativeBase):
         Returns:
             List[str]: Список имен полей.
         """
-        return cls.__mapper__.selectable.c.keys()
+        return list(cls._field_names)
 
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -77,7 +108,7 @@ class BaseModel(DeclarativeBase):
         Returns:
             Dict[str, Any]: Словарь, представляющий модель.
         """
-        return {c.name: getattr(self, c.name) for c in self.__table__.columns}
+        return {name: getattr(self, name) for name in self._field_names}
 
     def __repr__(self) -> str:
         """
@@ -103,6 +134,9 @@ class BaseModel(DeclarativeBase):
         """
         if not dict_field:
             return []
+        # Быстрый путь: все значения истинны, список ключей строится на уровне C
+        if all(dict_field.values()):
+            return list(dict_field)
         return [k for k, v in dict_field.items() if v]
 
     @staticmethod
@@ -119,4 +153,6 @@ class BaseModel(DeclarativeBase):
         """
         if not list_field:
             return {}
-        return {str(item): True for item in list_field} 
\ No newline at end of file
+        return dict.fromkeys(
+            (item if type(item) is str else str(item) for item in list_field), True
+        ) 
\ No newline at end of file
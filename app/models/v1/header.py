@@ -1,7 +1,6 @@
 from app.models.v1.base import BaseModel
-from sqlalchemy import String, Integer, Text, ForeignKey
-from sqlalchemy.orm import Mapped, mapped_column
-from sqlalchemy.ext.asyncio import AsyncAttrs
+from sqlalchemy import Boolean, String, Integer, Text, ForeignKey, Index, text
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 # Логотип сайта
 class LogoModel(BaseModel):
@@ -11,11 +10,26 @@ class LogoModel(BaseModel):
     Атрибуты:
         file_url (str): URL или путь к файлу логотипа.
         alt_text (str): Альтернативный текст для логотипа.
+        is_active (bool): Текущий логотип сайта. Новые логотипы создаются неактивными.
     """
     __tablename__ = "logo"
+    # Активным может быть только один логотип. Частичный уникальный индекс
+    # содержит не более одной строки, поэтому выбор текущего логотипа
+    # по is_active - поиск по индексу, а не сортировка всей таблицы.
+    __table_args__ = (
+        Index(
+            "uq_logo_is_active",
+            "is_active",
+            unique=True,
+            postgresql_where=text("is_active"),
+        ),
+    )
 
     file_url: Mapped[str] = mapped_column(String(256), nullable=False)
     alt_text: Mapped[str] = mapped_column(String(128), nullable=True)
+    is_active: Mapped[bool] = mapped_column(
+        Boolean, default=False, server_default=text("false"), nullable=False
+    )
 
 # Пункт меню
 class MenuItemModel(BaseModel):
@@ -27,14 +41,25 @@ class MenuItemModel(BaseModel):
         url (str): Ссылка.
         order (int): Порядок отображения.
         parent_id (int | None): ID родительского пункта меню (null для корневых).
+        children (list[MenuItemModel]): Вложенные пункты меню.
     """
     __tablename__ = "menu_item"
+    # Дерево меню выбирается по parent_id с сортировкой по order.
+    # Составной индекс покрывает и фильтр по parent_id, и сортировку.
+    __table_args__ = (Index("ix_menu_item_parent_id_order", "parent_id", "order"),)
 
     title: Mapped[str] = mapped_column(String(64), nullable=False)
     url: Mapped[str] = mapped_column(String(256), nullable=False)
     order: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     parent_id: Mapped[int | None] = mapped_column(Integer, ForeignKey("menu_item.id"), nullable=True)
 
+    # Загружается только по запросу: плоский список меню для header выбирается
+    # одним запросом, а дерево - через selectinload(MenuItemModel.children)
+    # или await item.awaitable_attrs.children
+    children: Mapped[list["MenuItemModel"]] = relationship(
+        order_by="MenuItemModel.order",
+    )
+
 # Контактная информация
 class ContactInfoModel(BaseModel):
     """
@@ -46,5 +71,5 @@ class ContactInfoModel(BaseModel):
     """
     __tablename__ = "contact_info"
 
-    type: Mapped[str] = mapped_column(String(32), nullable=False)
+    type: Mapped[str] = mapped_column(String(32), nullable=False, index=True)
     value: Mapped[str] = mapped_column(String(128), nullable=False) 
\ No newline at end of file
@@ -26,5 +26,19 @@ class UserModel(BaseModel):
     email: Mapped[str] = mapped_column(String(128), unique=True, nullable=False, index=True)
     username: Mapped[str] = mapped_column(String(64), unique=True, nullable=False, index=True)
     hashed_password: Mapped[str] = mapped_column(String(256), nullable=False)
-    role: Mapped[UserRole] = mapped_column(Enum(UserRole), default=UserRole.USER, nullable=False)
+    # Роль хранится строкой (VARCHAR + CHECK), а не типом ENUM PostgreSQL:
+    # asyncpg передает ее обычным текстовым кодеком, а новые роли
+    # добавляются без ALTER TYPE. В Python значение по-прежнему UserRole.
+    role: Mapped[UserRole] = mapped_column(
+        Enum(
+            UserRole,
+            name="role",
+            native_enum=False,
+            create_constraint=True,
+            length=16,
+            values_callable=lambda roles: [role.value for role in roles],
+        ),
+        default=UserRole.USER,
+        nullable=False,
+    )
     is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False) 
\ No newline at end of file
@@ -1,6 +1,11 @@
+from typing import Any, Callable, Tuple, Type
+
+from fastapi import Response
+from pydantic import BaseModel
+
 from app.routes.base import BaseRouter
 from dishka.integrations.fastapi import FromDishka, inject
-from app.services.v1.header.service import LogoService, MenuItemService, ContactInfoService
+from app.services.v1.header.service import LogoService, MenuItemService, ContactInfoService, HeaderService
 from app.schemas.v1.header.requests import (
     LogoCreateSchema, LogoUpdateSchema,
     MenuItemCreateSchema, MenuItemUpdateSchema,
@@ -9,88 +14,133 @@ from app.schemas.v1.header.requests import (
 from app.schemas.v1.header.responses import (
     LogoResponseSchema, LogoListResponseSchema,
     MenuItemResponseSchema, MenuItemListResponseSchema,
-    ContactInfoResponseSchema, ContactInfoListResponseSchema
+    ContactInfoResponseSchema, ContactInfoListResponseSchema,
+    HeaderResponseSchema
+)
+
+# (путь, обработчик, HTTP-метод, модель ответа, описание)
+Route = Tuple[str, Callable[..., Any], str, Type[BaseModel], str]
+
+
+async def get_logo() -> None:
+    """
+    Получить текущий логотип сайта.
+    """
+    pass
+
+
+async def create_logo(data: LogoCreateSchema) -> None:
+    """
+    Создать новый логотип.
+    """
+    pass
+
+
+async def update_logo(logo_id: int, data: LogoUpdateSchema) -> None:
+    """
+    Обновить логотип по ID.
+    """
+    pass
+
+
+async def get_menu() -> None:
+    """
+    Получить список пунктов меню.
+    """
+    pass
+
+
+async def create_menu_item(data: MenuItemCreateSchema) -> None:
+    """
+    Создать новый пункт меню.
+    """
+    pass
+
+
+async def update_menu_item(item_id: int, data: MenuItemUpdateSchema) -> None:
+    """
+    Обновить пункт меню по ID.
+    """
+    pass
+
+
+async def delete_menu_item(item_id: int) -> None:
+    """
+    Удалить пункт меню по ID.
+    """
+    pass
+
+
+async def get_contacts() -> None:
+    """
+    Получить список контактной информации.
+    """
+    pass
+
+
+async def create_contact(data: ContactInfoCreateSchema) -> None:
+    """
+    Создать новый контакт.
+    """
+    pass
+
+
+async def update_contact(contact_id: int, data: ContactInfoUpdateSchema) -> None:
+    """
+    Обновить контакт по ID.
+    """
+    pass
+
+
+async def delete_contact(contact_id: int) -> None:
+    """
+    Удалить контакт по ID.
+    """
+    pass
+
+
+@inject
+async def get_header(service: FromDishka[HeaderService]) -> Response:
+    """
+    Получить логотип, меню и контакты одним запросом.
+
+    JSON ответа берется из кеша Redis целиком, поэтому возвращается
+    напрямую, минуя повторную валидацию по HeaderResponseSchema.
+    """
+    return Response(
+        content=await service.get_header_json(), media_type="application/json"
+    )
+
+
+HEADER_ROUTES: Tuple[Route, ...] = (
+    ("/header", get_header, "GET", HeaderResponseSchema, "Получить данные header"),
+    ("/logo", get_logo, "GET", LogoResponseSchema, "Получить логотип"),
+    ("/logo", create_logo, "POST", LogoResponseSchema, "Создать логотип"),
+    ("/logo/{logo_id}", update_logo, "PATCH", LogoResponseSchema, "Обновить логотип"),
+    ("/menu", get_menu, "GET", MenuItemListResponseSchema, "Получить меню"),
+    ("/menu", create_menu_item, "POST", MenuItemResponseSchema, "Создать пункт меню"),
+    ("/menu/{item_id}", update_menu_item, "PATCH", MenuItemResponseSchema, "Обновить пункт меню"),
+    ("/menu/{item_id}", delete_menu_item, "DELETE", MenuItemResponseSchema, "Удалить пункт меню"),
+    ("/contacts", get_contacts, "GET", ContactInfoListResponseSchema, "Получить контакты"),
+    ("/contacts", create_contact, "POST", ContactInfoResponseSchema, "Создать контакт"),
+    ("/contacts/{contact_id}", update_contact, "PATCH", ContactInfoResponseSchema, "Обновить контакт"),
+    ("/contacts/{contact_id}", delete_contact, "DELETE", ContactInfoResponseSchema, "Удалить контакт"),
 )
 
 
 class HeaderRouter(BaseRouter):
     """
     Роутер для управления header (логотип, меню, контакты).
+
+    Обработчики объявлены на уровне модуля с явными сигнатурами, а configure
+    только регистрирует их по таблице HEADER_ROUTES.
     """
     def configure(self):
-        @self.router.get("/logo", response_model=LogoResponseSchema, summary="Получить логотип")
-        async def get_logo():
-            """
-            Получить текущий логотип сайта.
-            """
-            pass
-
-        @self.router.post("/logo", response_model=LogoResponseSchema, summary="Создать логотип")
-        async def create_logo(data: LogoCreateSchema):
-            """
-            Создать новый логотип.
-            """
-            pass
-
-        @self.router.patch("/logo/{logo_id}", response_model=LogoResponseSchema, summary="Обновить логотип")
-        async def update_logo(logo_id: int, data: LogoUpdateSchema):
-            """
-            Обновить логотип по ID.
-            """
-            pass
-
-        @self.router.get("/menu", response_model=MenuItemListResponseSchema, summary="Получить меню")
-        async def get_menu():
-            """
-            Получить список пунктов меню.
-            """
-            pass
-
-        @self.router.post("/menu", response_model=MenuItemResponseSchema, summary="Создать пункт меню")
-        async def create_menu_item(data: MenuItemCreateSchema):
-            """
-            Создать новый пункт меню.
-            """
-            pass
-
-        @self.router.patch("/menu/{item_id}", response_model=MenuItemResponseSchema, summary="Обновить пункт меню")
-        async def update_menu_item(item_id: int, data: MenuItemUpdateSchema):
-            """
-            Обновить пункт меню по ID.
-            """
-            pass
-
-        @self.router.delete("/menu/{item_id}", response_model=MenuItemResponseSchema, summary="Удалить пункт меню")
-        async def delete_menu_item(item_id: int):
-            """
-            Удалить пункт меню по ID.
-            """
-            pass
-
-        @self.router.get("/contacts", response_model=ContactInfoListResponseSchema, summary="Получить контакты")
-        async def get_contacts():
-            """
-            Получить список контактной информации.
-            """
-            pass
-
-        @self.router.post("/contacts", response_model=ContactInfoResponseSchema, summary="Создать контакт")
-        async def create_contact(data: ContactInfoCreateSchema):
-            """
-            Создать новый контакт.
-            """
-            pass
-
-        @self.router.patch("/contacts/{contact_id}", response_model=ContactInfoResponseSchema, summary="Обновить контакт")
-        async def update_contact(contact_id: int, data: ContactInfoUpdateSchema):
-            """
-            Обновить контакт по ID.
-            """
-            pass
-
-        @self.router.delete("/contacts/{contact_id}", response_model=ContactInfoResponseSchema, summary="Удалить контакт")
-        async def delete_contact(contact_id: int):
-            """
-            Удалить контакт по ID.
-            """
-            pass 
\ No newline at end of file
+        for path, endpoint, method, response_model, summary in HEADER_ROUTES:
+            self.router.add_api_route(
+                path,
+                endpoint,
+                methods=[method],
+                response_model=response_model,
+                summary=summary,
+            )
@@ -49,7 +49,12 @@ class BaseSchema(CommonBaseSchema):
         id (int): Идентификатор записи.
         created_at (datetime): Дата и время создания записи.
         updated_at (datetime): Дата и время последнего обновления записи.
+
+    Экземпляры неизменяемы: схема данных создается один раз при выдаче
+    ответа и после этого не модифицируется.
     """
+    model_config = ConfigDict(frozen=True)
+
     id: Optional[int] = None
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
@@ -65,6 +70,8 @@ class UserBaseSchema(CommonBaseSchema):
         created_at (datetime): Дата и время создания записи.
         updated_at (datetime): Дата и время последнего обновления записи.
     """
+    model_config = ConfigDict(frozen=True)
+
     id: Optional[uuid.UUID] = None
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
@@ -76,8 +83,11 @@ class BaseRequestSchema(CommonBaseSchema):
     и предоставляет общую конфигурацию для всех схем входных данных.
 
     Так как нету необходимости для ввода исходных данных id и даты создания и обновления.
+
+    Лишние поля во входных данных запрещены, экземпляры неизменяемы.
+    Сборка валидатора отложена до первого использования схемы.
     """
-    pass
+    model_config = ConfigDict(defer_build=True, extra="forbid", frozen=True)
 
 class BaseCommonResponseSchema(CommonBaseSchema):
     """
@@ -99,7 +109,11 @@ class BaseResponseSchema(CommonBaseSchema):
     Атрибуты:
         success (bool): Указывает, успешен ли запрос.
         message (Optional[str]): Сообщение, связанное с ответом.
+
+    Сборка валидатора и сериализатора отложена до первого использования схемы.
     """
+    model_config = ConfigDict(defer_build=True)
+
     success: bool = True
     message: Optional[str] = None
 
@@ -1,5 +1,5 @@
-from app.schemas.v1.base import BaseSchema, BaseRequestSchema
-from typing import Optional
+from app.schemas.v1.base import BaseSchema, BaseRequestSchema, BaseCommonResponseSchema
+from typing import List, Optional
 
 class LogoBaseSchema(BaseSchema):
     """
@@ -36,4 +36,17 @@ class ContactInfoBaseSchema(BaseSchema):
         value (str): Значение контакта.
     """
     type: str
-    value: str 
\ No newline at end of file
+    value: str
+
+class HeaderSchema(BaseCommonResponseSchema):
+    """
+    Сводные данные header: логотип, меню и контакты.
+
+    Атрибуты:
+        logo (LogoBaseSchema | None): Текущий логотип.
+        menu (List[MenuItemBaseSchema]): Пункты меню.
+        contacts (List[ContactInfoBaseSchema]): Контактная информация.
+    """
+    logo: Optional[LogoBaseSchema] = None
+    menu: List[MenuItemBaseSchema] = []
+    contacts: List[ContactInfoBaseSchema] = []
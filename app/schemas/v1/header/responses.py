@@ -1,5 +1,5 @@
 from app.schemas.v1.base import BaseResponseSchema, ItemResponseSchema, ListResponseSchema
-from app.schemas.v1.header.base import LogoBaseSchema, MenuItemBaseSchema, ContactInfoBaseSchema
+from app.schemas.v1.header.base import LogoBaseSchema, MenuItemBaseSchema, ContactInfoBaseSchema, HeaderSchema
 from typing import List, Optional
 
 class LogoResponseSchema(ItemResponseSchema[LogoBaseSchema]):
@@ -66,4 +66,31 @@ class ContactInfoListResponseSchema(ListResponseSchema[ContactInfoBaseSchema]):
         message (str): Сообщение.
         items (List[ContactInfoBaseSchema]): Список контактов.
     """
-    pass 
\ No newline at end of file
+    pass
+
+class HeaderResponseSchema(ItemResponseSchema[HeaderSchema]):
+    """
+    Ответ на запрос сводных данных header.
+
+    Атрибуты:
+        success (bool): Успешность операции.
+        message (str): Сообщение.
+        item (HeaderSchema): Логотип, меню и контакты.
+    """
+    pass
+
+
+# Схемы ответов собираются лениво (defer_build в BaseResponseSchema), но
+# ответы header отдаются на каждой странице, поэтому их валидаторы строятся
+# при импорте, а не на первом запросе к эндпоинту.
+for _schema in (
+    LogoResponseSchema,
+    LogoListResponseSchema,
+    MenuItemResponseSchema,
+    MenuItemListResponseSchema,
+    ContactInfoResponseSchema,
+    ContactInfoListResponseSchema,
+    HeaderResponseSchema,
+):
+    _schema.model_rebuild()
+del _schema
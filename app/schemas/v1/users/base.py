@@ -2,13 +2,17 @@
 Модуль схем пользователя.
 """
 
-from typing import Optional
+from typing import Annotated, Optional
 
-from pydantic import EmailStr
+from pydantic import ConfigDict, EmailStr, StringConstraints
 
 from app.models.v1.users import UserRole
 from app.schemas.v1.base import BaseSchema, CommonBaseSchema
 
+# Имя пользователя во входных данных: один тип для всех схем,
+# чтобы ограничения длины были объявлены в одном месте
+Username = Annotated[str, StringConstraints(min_length=2, max_length=50)]
+
 
 class UserSchema(BaseSchema):
     """
@@ -39,6 +43,8 @@ class CurrentUserSchema(CommonBaseSchema):
         is_active (bool): Активен ли пользователь
     """
 
+    model_config = ConfigDict(frozen=True)
+
     id: int
     username: str
     email: EmailStr
@@ -7,6 +7,8 @@ from pydantic import EmailStr, Field
 from app.models.v1.users import UserRole
 from app.schemas.v1.base import BaseRequestSchema
 
+from .base import Username
+
 
 class UserCredentialsSchema(BaseRequestSchema):
     """
@@ -37,10 +39,7 @@ class UserUpdateSchema(BaseRequestSchema):
         username (str | None): Имя пользователя.
     """
 
-    username: str | None = Field(None, min_length=2, max_length=50)
-
-    class Config:
-        extra = "forbid"
+    username: Username | None = None
 
 
 class ToggleUserActiveSchema(BaseRequestSchema):
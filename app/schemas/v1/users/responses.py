@@ -25,6 +25,9 @@ class UserUpdateResponseSchema(BaseResponseSchema):
     """
     Схема ответа при обновлении данных пользователя.
 
+    Используется и для смены роли, и для смены статуса активности;
+    при необходимости сообщение передается при создании ответа.
+
     Attributes:
         message (str): Сообщение о результате операции.
         data (UserDetailDataSchema): Обновленные данные пользователя.
@@ -34,30 +37,6 @@ class UserUpdateResponseSchema(BaseResponseSchema):
     data: UserDetailDataSchema
 
 
-class UserRoleUpdateResponseSchema(UserUpdateResponseSchema):
-    """
-    Схема ответа при обновлении роли пользователя.
-
-    Attributes:
-        message (str): Сообщение о результате операции.
-        data (UserDetailDataSchema): Обновленные данные пользователя.
-    """
-
-    message: str = "Роль пользователя успешно обновлена"
-
-
-class UserActiveUpdateResponseSchema(UserUpdateResponseSchema):
-    """
-    Схема ответа при обновлении статуса активности пользователя.
-
-    Attributes:
-        message (str): Сообщение о результате операции.
-        data (UserDetailDataSchema): Обновленные данные пользователя.
-    """
-
-    message: str = "Статус активности пользователя успешно обновлен"
-
-
 class UserDeleteResponseSchema(BaseResponseSchema):
     """
     Схема ответа при удалении пользователя.
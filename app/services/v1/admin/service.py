@@ -8,7 +8,7 @@
 """
 import logging
 from typing import Optional
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import async_sessionmaker
 from app.services.v1.base import BaseService
 from app.services.v1.users.data_manager import UserDataManager
 from app.models.v1.users import UserModel, UserRole
@@ -19,20 +19,21 @@ logger = logging.getLogger(__name__)
 class AdminInitService(BaseService):
     """
     Сервис для инициализации и управления администраторами.
-    
+
+    Сервис не хранит сессию базы данных и открывает ее в каждом методе,
+    поэтому один экземпляр используется все время работы приложения.
+
     Attributes:
-        session (AsyncSession): Сессия базы данных
-        data_manager (UserDataManager): Менеджер данных пользователей
+        session_factory (async_sessionmaker): Фабрика сессий базы данных
     """
-    def __init__(self, session: AsyncSession):
+    def __init__(self, session_factory: async_sessionmaker):
         """
         Инициализирует сервис.
-        
+
         Args:
-            session (AsyncSession): Сессия базы данных
+            session_factory (async_sessionmaker): Фабрика сессий базы данных
         """
-        self.session = session
-        self.data_manager = UserDataManager(session)
+        self.session_factory = session_factory
 
     async def initialize_admin(self, admin_email: str, password: Optional[str] = None, username: str = "admin") -> None:
         """
@@ -58,28 +59,36 @@ class AdminInitService(BaseService):
                 return
             password = settings.ADMIN_PASSWORD.get_secret_value()
 
-        # Проверяем, есть ли уже администраторы
-        admins = await self.data_manager.filter_by(role=UserRole.ADMIN)
-        if admins:
-            logger.info("Администратор уже существует: %s", [a.email for a in admins])
-            return
-        
-        # Ищем пользователя с указанным email
-        user = await self.data_manager.get_model_by_field("email", admin_email)
-        if user:
-            # Назначаем роль администратора
-            user.role = UserRole.ADMIN
-            user.hashed_password = PasswordHasher.hash_password(password)
-            await self.session.commit()
-            logger.info("Пользователь %s назначен администратором", admin_email)
-        else:
-            # Создаём нового пользователя-админа
-            new_user = UserModel(
-                email=admin_email,
-                username=username,
-                hashed_password=PasswordHasher.hash_password(password),
-                role=UserRole.ADMIN,
-                is_active=True,
-            )
-            await self.data_manager.add_one(new_user)
-            logger.info("Создан новый администратор: %s", admin_email)
\ No newline at end of file
+        async with self.session_factory() as session:
+            data_manager = UserDataManager(session)
+
+            # Проверяем, есть ли уже администраторы
+            if await data_manager.admin_exists():
+                logger.info("Администратор уже существует")
+                return
+
+            # Ищем пользователя с указанным email
+            user = await data_manager.get_model_by_attr(UserModel.email, admin_email)
+            if user:
+                # Назначаем роль администратора
+                user.role = UserRole.ADMIN
+                # Хеш пересчитывается, только если пароль отличается:
+                # проверка и хеширование Argon2 стоят одинаково, а при
+                # совпадении пароля новый хеш не нужен
+                if not user.hashed_password or not await PasswordHasher.verify_async(
+                    user.hashed_password, password
+                ):
+                    user.hashed_password = await PasswordHasher.hash_password_async(password)
+                await session.commit()
+                logger.info("Пользователь %s назначен администратором", admin_email)
+            else:
+                # Создаём нового пользователя-админа
+                new_user = UserModel(
+                    email=admin_email,
+                    username=username,
+                    hashed_password=await PasswordHasher.hash_password_async(password),
+                    role=UserRole.ADMIN,
+                    is_active=True,
+                )
+                await data_manager.add_one(new_user)
+                logger.info("Создан новый администратор: %s", admin_email)
\ No newline at end of file
@@ -1,9 +1,54 @@
-from typing import Optional
+from typing import Any, Optional
+from sqlalchemy import CompoundSelect, Row, bindparam, literal_column, select, union_all
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.models.v1.users import UserModel
+from app.models.v1.users import UserModel, UserRole
 from app.services.v1.base import BaseEntityManager
 from app.schemas.v1.base import BaseSchema
 
+_CREDENTIAL_COLUMNS = (
+    UserModel.id,
+    UserModel.username,
+    UserModel.email,
+    UserModel.role,
+    UserModel.hashed_password,
+)
+
+
+def _build_identifier_query(*columns: Any, admin_only: bool = False) -> CompoundSelect:
+    """
+    Собирает запрос поиска пользователя по username или email.
+
+    Запрос состоит из двух веток UNION ALL с LIMIT 1, каждая из которых
+    использует свой уникальный индекс (username и email). Каждая ветка
+    добавляет колонку priority, и сортировка по ней гарантирует, что
+    совпадение по username приоритетнее совпадения по email.
+
+    Args:
+        *columns: Выбираемые колонки или модель
+        admin_only: Искать только пользователей с ролью администратора
+
+    Returns:
+        CompoundSelect: Запрос с параметром identifier
+    """
+    branches = []
+    for priority, column in enumerate((UserModel.username, UserModel.email)):
+        branch = select(*columns, literal_column(str(priority)).label("priority")).where(
+            column == bindparam("identifier")
+        )
+        if admin_only:
+            branch = branch.where(UserModel.role == UserRole.ADMIN)
+        branches.append(branch.limit(1))
+    return union_all(*branches).order_by("priority").limit(1)
+
+
+# Запросы данных для аутентификации собираются один раз при импорте модуля,
+# идентификатор подставляется через bindparam при выполнении
+_USER_CREDENTIALS_QUERY = _build_identifier_query(*_CREDENTIAL_COLUMNS)
+_ADMIN_CREDENTIALS_QUERY = _build_identifier_query(
+    *_CREDENTIAL_COLUMNS, admin_only=True
+)
+
+
 class AuthDataManager(BaseEntityManager[BaseSchema]):
     """
     Менеджер данных для поиска пользователей по username или email.
@@ -12,18 +57,24 @@ class AuthDataManager(BaseEntityManager[BaseSchema]):
     def __init__(self, session: AsyncSession):
         super().__init__(session=session, schema=BaseSchema, model=UserModel)
 
-    async def get_user_by_identifier(self, identifier: str) -> Optional[UserModel]:
+    async def get_user_credentials(
+        self, identifier: str, admin_only: bool = False
+    ) -> Optional[Row]:
         """
-        Получает пользователя по username или email.
-        """
-        # Поиск по username
-        user = await self.get_model_by_field("username", identifier)
-        if user:
-            return user
+        Получает данные для аутентификации пользователя по username или email.
+
+        Выбирает только поля, необходимые для проверки входа, одним запросом.
 
-        # Поиск по email (если поле есть)
-        user = await self.get_model_by_field("email", identifier)
-        if user:
-            return user
+        Args:
+            identifier: Имя пользователя или email
+            admin_only: Искать только пользователей с ролью администратора
 
-        return None 
\ No newline at end of file
+        Returns:
+            Строка с полями id, username, email, role, hashed_password
+            (и служебным priority) или None, если пользователь не найден
+        """
+        statement = (
+            _ADMIN_CREDENTIALS_QUERY if admin_only else _USER_CREDENTIALS_QUERY
+        )
+        result = await self.session.execute(statement, {"identifier": identifier})
+        return result.first()
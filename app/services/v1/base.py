@@ -1,5 +1,5 @@
 import logging
-from typing import Any, Callable, Generic, List, Optional, Tuple, Type, TypeVar
+from typing import Any, Callable, ClassVar, Generic, List, Optional, Tuple, Type, TypeVar
 
 from sqlalchemy import and_, asc, delete, desc, func, or_, select, text
 from sqlalchemy.exc import SQLAlchemyError
@@ -15,11 +15,47 @@ M = TypeVar("M", bound=BaseModel)
 T = TypeVar("T", bound=BaseSchema)
 
 
+def build_trusted_schema(schema: Type[T], obj: Any) -> T:
+    """
+    Создает схему из модели SQLAlchemy без повторной валидации.
+
+    Данные из базы уже приведены к типам колонок, поэтому схема собирается
+    через model_construct: значения полей берутся из атрибутов модели,
+    отсутствующие заполняются значениями по умолчанию схемы.
+    Для любых других объектов (например, результата transform_func)
+    выполняется обычная валидация.
+
+    Args:
+        schema: Класс схемы Pydantic
+        obj: Модель SQLAlchemy или произвольный объект
+
+    Returns:
+        T: Экземпляр схемы
+    """
+    if not isinstance(obj, BaseModel):
+        return schema.model_validate(obj)
+    values = {
+        name: getattr(obj, name)
+        for name in schema.model_fields
+        if name in obj._field_names
+    }
+    return schema.model_construct(**values)
+
+
 class SessionMixin:
     """
     Миксин для предоставления экземпляра сессии базы данных.
+
+    Сервисы и менеджеры данных создаются на каждый запрос, поэтому логгер
+    получается один раз при объявлении класса, а не в каждом __init__.
     """
 
+    logger: ClassVar[logging.Logger] = logging.getLogger(__name__)
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls.logger = logging.getLogger(cls.__name__)
+
     def __init__(self, session: AsyncSession) -> None:
         """
         Инициализирует SessionMixin.
@@ -37,7 +73,6 @@ class BaseService(SessionMixin):
 
     def __init__(self, session: AsyncSession):
         super().__init__(session)
-        self.logger = logging.getLogger(self.__class__.__name__)
 
 
 class BaseDataManager(SessionMixin, Generic[T]):
@@ -62,7 +97,6 @@ class BaseDataManager(SessionMixin, Generic[T]):
         super().__init__(session)
         self.schema = schema
         self.model = model
-        self.logger = logging.getLogger(self.__class__.__name__)
 
     async def add_one(self, model: M) -> M:
         """
@@ -118,7 +152,7 @@ class BaseDataManager(SessionMixin, Generic[T]):
             self.logger.info("Получение записи из базы данных")
             self.logger.debug("SQL-запрос: %s", select_statement)
             result = await self.session.execute(select_statement)
-            return result.scalar()
+            return result.scalars().first()
         except SQLAlchemyError as e:
             self.logger.error("Ошибка при получении записи: %s", e)
             raise
@@ -681,7 +715,7 @@ class BaseEntityManager(BaseDataManager[T]):
             user_schema = await data_manager.add_item(new_user)
         """
         model_instance = await self.add_one(model)
-        return self.schema.model_validate(model_instance)
+        return build_trusted_schema(self.schema, model_instance)
 
     async def get_item(self, item_id: int) -> T | None:
         """
@@ -697,7 +731,7 @@ class BaseEntityManager(BaseDataManager[T]):
         model_instance = await self.get_one(statement)
         if model_instance is None:
             return None
-        return self.schema.model_validate(model_instance)
+        return build_trusted_schema(self.schema, model_instance)
 
     async def get_item_by_field(self, field: str, value: Any) -> Optional[T]:
         """
@@ -710,18 +744,22 @@ class BaseEntityManager(BaseDataManager[T]):
         Returns:
             T | None: Найденная запись в виде схемы или None
         """
-        statement = select(self.model).where(getattr(self.model, field) == value)
+        statement = (
+            select(self.model).where(getattr(self.model, field) == value).limit(1)
+        )
         model_instance = await self.get_one(statement)
 
         if model_instance is None:
             return None
 
-        return self.schema.model_validate(model_instance)
+        return build_trusted_schema(self.schema, model_instance)
 
     async def get_model_by_field(self, field: str, value: Any) -> Optional[M]:
         """
         Получает запись по значению поля в виде модели базы данных.
 
+        Устарело: используйте get_model_by_attr с атрибутом модели.
+
         Args:
             field: Имя поля
             value: Значение поля
@@ -729,7 +767,26 @@ class BaseEntityManager(BaseDataManager[T]):
         Returns:
             M | None: Найденная запись в виде модели базы данных или None
         """
-        statement = select(self.model).where(getattr(self.model, field) == value)
+        return await self.get_model_by_attr(getattr(self.model, field), value)
+
+    async def get_model_by_attr(self, column: Any, value: Any) -> Optional[M]:
+        """
+        Получает запись по значению колонки в виде модели базы данных.
+
+        Колонка передается атрибутом модели, а не строкой, поэтому
+        опечатки в имени поля видны статическим анализаторам.
+
+        Args:
+            column: Атрибут модели, например UserModel.email
+            value: Значение колонки
+
+        Returns:
+            M | None: Найденная запись в виде модели базы данных или None
+
+        Usage:
+            user = await data_manager.get_model_by_attr(UserModel.email, email)
+        """
+        statement = select(self.model).where(column == value).limit(1)
         return await self.get_one(statement)
 
     async def get_items(
@@ -758,7 +815,7 @@ class BaseEntityManager(BaseDataManager[T]):
         if transform_func:
             models = [transform_func(model) for model in models]
 
-        return [schema_to_use.model_validate(model) for model in models]
+        return [build_trusted_schema(schema_to_use, model) for model in models]
 
     async def get_items_by_field(self, field: str, value: any) -> list[T]:
         """
@@ -829,7 +886,7 @@ class BaseEntityManager(BaseDataManager[T]):
             for model in models:
                 if transform_func:
                     model = transform_func(model)
-                items.append(schema_to_use.model_validate(model))
+                items.append(build_trusted_schema(schema_to_use, model))
 
 
         except SQLAlchemyError as e:
@@ -862,7 +919,7 @@ class BaseEntityManager(BaseDataManager[T]):
         updated_model = await self.update_one(model_instance, updated_item)
 
         # Преобразуем модель в схему
-        return self.schema.model_validate(updated_model)
+        return build_trusted_schema(self.schema, updated_model)
 
     async def update_items(self, item_id: int, fields: dict) -> T:
         """
@@ -893,7 +950,7 @@ class BaseEntityManager(BaseDataManager[T]):
         updated_model = await self.update_some(model, fields)
 
         # Преобразуем модель в схему
-        return self.schema.model_validate(updated_model)
+        return build_trusted_schema(self.schema, updated_model)
 
     async def delete_item(self, item_id: int) -> bool:
         """
@@ -1000,4 +1057,4 @@ class BaseEntityManager(BaseDataManager[T]):
             created_user_schemas = await data_manager.bulk_create_items(users)
         """
         model_instances = await self.bulk_create(models)
-        return [self.schema.model_validate(model) for model in model_instances]
+        return [build_trusted_schema(self.schema, model) for model in model_instances]
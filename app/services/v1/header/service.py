@@ -1,6 +1,18 @@
-from app.services.v1.base import BaseService
+import asyncio
+from typing import List, Optional
+
+from redis.asyncio import Redis
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.settings import settings
+from app.models.v1.header import ContactInfoModel, LogoModel, MenuItemModel
+from app.schemas.v1.header.base import (
+    ContactInfoBaseSchema, HeaderSchema, LogoBaseSchema, MenuItemBaseSchema
+)
+from app.schemas.v1.header.responses import HeaderResponseSchema
+from app.services.v1.base import BaseService, build_trusted_schema
 from app.services.v1.header.data_manager import LogoDataManager, MenuItemDataManager, ContactInfoDataManager
-from sqlalchemy.ext.asyncio import AsyncSession
 
 class LogoService(BaseService):
     """
@@ -33,4 +45,108 @@ class ContactInfoService(BaseService):
     """
     def __init__(self, session: AsyncSession):
         super().__init__(session)
-        self.data_manager = ContactInfoDataManager(session) 
\ No newline at end of file
+        self.data_manager = ContactInfoDataManager(session) 
+
+class HeaderService(BaseService):
+    """
+    Сервис сводных данных header (логотип, меню, контакты).
+
+    Данные отдаются одним ответом и кешируются в Redis под одним ключом,
+    поэтому страница получает header за один HTTP-запрос и одно обращение
+    к Redis вместо трех.
+
+    Сервис не держит сессию базы данных: при промахе кеша каждый из трех
+    запросов выполняется в своей сессии, чтобы они шли параллельно.
+    Кеш сбрасывается при изменении логотипа, меню или контактов
+    в админ-панели.
+
+    Args:
+        session_factory (async_sessionmaker): Фабрика сессий базы данных.
+        redis (Redis): Клиент Redis.
+    """
+    CACHE_KEY = "header:response"
+
+    def __init__(self, session_factory: async_sessionmaker, redis: Redis):
+        self.session_factory = session_factory
+        self.redis = redis
+
+    async def get_header_json(self) -> str:
+        """
+        Возвращает готовый JSON ответа GET /header.
+
+        В Redis хранится сериализованный HeaderResponseSchema, поэтому при
+        попадании в кеш ответ отдается клиенту как есть: без запросов к базе,
+        без валидации и повторной сериализации Pydantic.
+
+        Returns:
+            str: JSON ответа с логотипом, меню и контактами
+        """
+        cached = await self.redis.get(self.CACHE_KEY)
+        if cached:
+            return cached
+
+        header = await self.get_header()
+        payload = HeaderResponseSchema(item=header).model_dump_json()
+        await self.redis.setex(self.CACHE_KEY, settings.HEADER_CACHE_TTL, payload)
+        return payload
+
+    async def get_header(self) -> HeaderSchema:
+        """
+        Загружает логотип, меню и контакты из базы данных.
+
+        Запросы выполняются параллельно через asyncio.gather, каждый
+        в отдельной сессии: AsyncSession не допускает параллельных
+        запросов в одной сессии.
+
+        Returns:
+            HeaderSchema: Сводные данные header
+        """
+        logo, menu, contacts = await asyncio.gather(
+            self._get_logo(), self._get_menu(), self._get_contacts()
+        )
+        return HeaderSchema(logo=logo, menu=menu, contacts=contacts)
+
+    async def _get_logo(self) -> Optional[LogoBaseSchema]:
+        """
+        Получает текущий (активный) логотип.
+
+        Returns:
+            Optional[LogoBaseSchema]: Логотип или None, если он не задан
+        """
+        async with self.session_factory() as session:
+            logo = await LogoDataManager(session).get_one(
+                select(LogoModel).where(LogoModel.is_active.is_(True))
+            )
+        return build_trusted_schema(LogoBaseSchema, logo) if logo else None
+
+    async def _get_menu(self) -> List[MenuItemBaseSchema]:
+        """
+        Получает пункты меню, упорядоченные по родителю и порядку.
+
+        Returns:
+            List[MenuItemBaseSchema]: Пункты меню
+        """
+        async with self.session_factory() as session:
+            return await MenuItemDataManager(session).get_items(
+                select(MenuItemModel).order_by(MenuItemModel.parent_id, MenuItemModel.order)
+            )
+
+    async def _get_contacts(self) -> List[ContactInfoBaseSchema]:
+        """
+        Получает контактную информацию.
+
+        Returns:
+            List[ContactInfoBaseSchema]: Контакты
+        """
+        async with self.session_factory() as session:
+            return await ContactInfoDataManager(session).get_items(
+                select(ContactInfoModel).order_by(ContactInfoModel.id)
+            )
+
+    async def invalidate_cache(self) -> None:
+        """
+        Удаляет сводные данные header из кеша.
+
+        Вызывается после изменения логотипа, меню или контактов.
+        """
+        await self.redis.delete(self.CACHE_KEY)
@@ -4,11 +4,33 @@
 Работает только с моделями SQLAlchemy. Преобразование в схемы - задача сервисного слоя.
 """
 
+from typing import List, Tuple
+
+from sqlalchemy import exists, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.models.v1.users import UserModel
+from sqlalchemy.orm import load_only
+from app.models.v1.users import UserModel, UserRole
 from app.schemas.v1.users import UserSchema
+from app.schemas.v1.pagination import PaginationParams
 from app.services.v1.base import BaseEntityManager
 
+# Проверка наличия администратора: SELECT EXISTS останавливается
+# на первой найденной строке и возвращает одно булево значение
+_ADMIN_EXISTS_QUERY = select(exists().where(UserModel.role == UserRole.ADMIN))
+
+# Список пользователей выбирает только колонки UserSchema, без хеша пароля
+_USER_LIST_QUERY = select(UserModel).options(
+    load_only(
+        UserModel.id,
+        UserModel.username,
+        UserModel.email,
+        UserModel.role,
+        UserModel.is_active,
+        UserModel.created_at,
+        UserModel.updated_at,
+    )
+)
+
 class UserDataManager(BaseEntityManager[UserSchema]):
     """
     Менеджер данных для композитных операций с пользователями.
@@ -18,3 +40,27 @@ class UserDataManager(BaseEntityManager[UserSchema]):
     def __init__(self, session: AsyncSession):
         super().__init__(session,schema=UserSchema, model=UserModel)
 
+    async def admin_exists(self) -> bool:
+        """
+        Проверяет, есть ли в системе хотя бы один администратор.
+
+        Returns:
+            bool: True, если администратор существует
+        """
+        return bool(await self.session.scalar(_ADMIN_EXISTS_QUERY))
+
+    async def list_users(
+        self, pagination: PaginationParams
+    ) -> Tuple[List[UserSchema], int]:
+        """
+        Получает страницу пользователей для списков в админке.
+
+        Выбираются только поля, которые отдаются в UserSchema.
+
+        Args:
+            pagination: Параметры пагинации
+
+        Returns:
+            Tuple[List[UserSchema], int]: Пользователи на странице и общее количество
+        """
+        return await self.get_paginated_items(_USER_LIST_QUERY, pagination)
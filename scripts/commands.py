@@ -5,14 +5,14 @@
 1. dev() -> Главная команда разработки:
    - start_infrastructure() -> Запуск всей инфраструктуры
      - load_env_vars() -> Загрузка конфигурации
-     - Проверка занятых портов через is_port_free()
+     - Проверка занятых портов через check_ports_free()
      - Проверка Docker daemon
      - run_compose_command("down") -> Очистка старых контейнеров
-     - get_available_port() -> Поиск свободных портов для сервисов
+     - get_available_ports() -> Параллельный поиск свободных портов для сервисов
      - run_compose_command("up -d") -> Запуск контейнеров
      - check_services() -> Ожидание готовности сервисов
      - migrate() -> Применение миграций БД
-   - find_free_port() -> Поиск порта для FastAPI
+   - get_port("FASTAPI_PORT") -> Порт FastAPI, подобранный в start_infrastructure()
    - uvicorn.run() -> Запуск сервера разработки
 
 Вспомогательные команды:
@@ -24,16 +24,22 @@
 - create_database() -> Создание БД если не существует
 - get_postgres_container_name() -> Поиск контейнера PostgreSQL
 """
+import hashlib
 import os
+import shutil
 import subprocess
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
-import time
+from typing import Iterable, Optional
 import socket
 import platform
-import threading
+import re
 import sys
+import tempfile
 import asyncio
+import contextlib
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 import uvicorn
 import asyncpg
 
@@ -64,6 +70,9 @@ ROOT_DIR = Path(__file__).parents[1]
 
 COMPOSE_FILE_WITHOUT_BACKEND = "docker-compose.dev.yml"
 
+# Отпечаток миграций и моделей, с которыми создавалась тестовая БД
+TEST_DB_FINGERPRINT_FILE = ROOT_DIR / ".pytest_dbhash"
+
 DEFAULT_PORTS = {
     'FASTAPI': 8000,
     'RABBITMQ': 5672,      # Порт для AMQP
@@ -74,6 +83,12 @@ DEFAULT_PORTS = {
     'REDIS_COMMANDER': 8081,
 }
 
+# Дефолтные порты по имени переменной окружения (например 'REDIS_PORT')
+_DEFAULT_PORT_BY_ENV_KEY = {f"{name}_PORT": port for name, port in DEFAULT_PORTS.items()}
+
+# Имена контейнеров из последнего docker ps в start_infrastructure
+_LAST_DOCKER_PS: list[str] = []
+
 def load_env_vars(env_file_path: str = None) -> dict:
     """
     Загружает переменные окружения из .env файла
@@ -98,32 +113,55 @@ def load_env_vars(env_file_path: str = None) -> dict:
             print("❌ Не найден файл конфигурации (.env.dev или .env.test)")
             return {}
 
-    env_vars = {}
-    if os.path.exists(env_file_path):
-        with open(env_file_path, encoding="utf-8") as f:
-            for line in f:
-                if line.strip() and not line.startswith('#'):
-                    try:
-                        key, value = line.strip().split('=', 1)
-                        # Убираем кавычки если есть
-                        value = value.strip('"\'')
-                        env_vars[key] = value
-                    except ValueError:
-                        # Пропускаем некорректные строки
-                        pass
-    else:
+    try:
+        mtime_ns = os.stat(env_file_path).st_mtime_ns
+    except FileNotFoundError:
         print(f"❌ Файл конфигурации не найден: {env_file_path}")
+        return {}
+
+    # Копия, чтобы вызывающий код не менял закешированный словарь
+    return dict(_parse_env_file(env_file_path, mtime_ns))
+
+# Строка вида KEY=value; комментарии и некорректные строки не совпадают,
+# окружающие значение кавычки отбрасываются
+_ENV_LINE_RE = re.compile(
+    r'^[ \t]*([A-Za-z_][A-Za-z0-9_]*)[ \t]*=[ \t]*["\']?(.*?)["\']?[ \t]*$',
+    re.MULTILINE,
+)
+
+@lru_cache(maxsize=8)
+def _parse_env_file(env_file_path: str, mtime_ns: int) -> dict:
+    """
+    Разбирает .env файл в словарь.
+
+    Результат кешируется по пути и времени изменения файла: повторные
+    вызовы load_env_vars() за время запуска не перечитывают файл,
+    а после его изменения он разбирается заново.
 
-    return env_vars
+    Args:
+        env_file_path: Путь к файлу .env
+        mtime_ns: Время изменения файла (часть ключа кеша)
 
-def run_compose_command(command: str | list, compose_file: str = COMPOSE_FILE_WITHOUT_BACKEND, env: dict = None) -> None:
+    Returns:
+        dict: Словарь с переменными окружения
+    """
+    env_content = Path(env_file_path).read_text(encoding="utf-8")
+    return dict(_ENV_LINE_RE.findall(env_content))
+
+def run_compose_command(
+    command: str | list,
+    compose_file: str = COMPOSE_FILE_WITHOUT_BACKEND,
+    env: dict = None,
+    show_progress: bool = False,
+) -> None:
     """
-    Запускает docker-compose команду в корне проекта
+    Запускает docker compose команду в корне проекта
 
     Args:
         command: Команда для docker-compose
         compose_file: Путь к docker-compose файлу. По умолчанию используется COMPOSE_FILE_WITHOUT_BACKEND из констант
         env: Переменные окружения для docker-compose. По умолчанию используется DEV_ENV_FILE из констант
+        show_progress: Выводить ход выполнения одной строкой статуса (см. run_with_status_line)
 
     Returns:
         None
@@ -156,34 +194,69 @@ def run_compose_command(command: str | list, compose_file: str = COMPOSE_FILE_WI
     if env:
         environment.update(env)
 
-    # show_output = any(cmd in command for cmd in ['up', 'build'])
-
+    argv = [*get_compose_command(), "-f", compose_file, *command]
     try:
-        subprocess.run(
-            ["docker-compose", "-f", compose_file] + command,
-            cwd=ROOT_DIR,
-            check=True,
-            env=environment,
-            # capture_output=not show_output,
-            text=True
-        )
+        if show_progress:
+            run_with_status_line(argv, cwd=ROOT_DIR, env=environment)
+        else:
+            subprocess.run(argv, cwd=ROOT_DIR, check=True, env=environment, text=True)
     except subprocess.CalledProcessError as e:
         error_output = e.stderr or e.stdout or str(e)
         if "docker daemon is not running" in error_output or "pipe/docker_engine" in error_output:
             raise DockerDaemonNotRunningError() from e
         elif "Conflict" in error_output and "is already in use by container" in error_output:
-            import re
             container_match = re.search(r'The container name "([^"]+)"', error_output)
             container_name = container_match.group(1) if container_match else None
             raise DockerContainerConflictError(container_name) from e
         raise
 
+def _make_probe_socket() -> socket.socket:
+    """
+    Создает TCP сокет для проверки портов.
+
+    SO_REUSEADDR позволяет занять порт в состоянии TIME_WAIT, поэтому
+    недавно освобожденные порты не считаются занятыми. На Windows флаг
+    не ставится: там он разрешает bind и на реально занятый порт.
+
+    Returns:
+        socket.socket: Сокет для проверки портов
+    """
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    if os.name != "nt":
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    return sock
+
+def _scan_for_free_port(start_port: int, error_message: str) -> int:
+    """
+    Ищет первый свободный порт начиная с указанного.
+
+    Для всего поиска используется один сокет: неудачный bind
+    не мешает повторить его на следующем порту.
+
+    Args:
+        start_port: Начальный порт для поиска
+        error_message: Текст ошибки, если свободный порт не найден
+
+    Returns:
+        int: Номер свободного порта
+
+    Raises:
+        RuntimeError: Если все порты до 65535 заняты
+    """
+    with _make_probe_socket() as sock:
+        for port in range(start_port, 65536):
+            try:
+                sock.bind(('', port))
+                return port
+            except OSError:
+                continue
+    raise RuntimeError(error_message)
+
 def find_free_port(start_port: int = 8000) -> int:
     """
     Ищет первый свободный порт начиная с указанного.
 
     Используется для FastAPI сервера в dev режиме.
-    Проверяет возможность bind на порт через socket.
 
     Args:
         start_port: Начальный порт для поиска
@@ -194,22 +267,14 @@ def find_free_port(start_port: int = 8000) -> int:
     Raises:
         RuntimeError: Если все порты до 65535 заняты
     """
-    port = start_port
-    while port < 65535:
-        try:
-            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                s.bind(('', port))
-                return port
-        except OSError:
-            port += 1
-    raise RuntimeError("Нет свободных портов! Ахуеть!")
+    return _scan_for_free_port(start_port, "Нет свободных портов! Ахуеть!")
 
 def get_available_port(default_port: int) -> int:
     """
-    Аналог find_free_port но с другим сообщением об ошибке.
+    Ищет свободный порт для инфраструктурного сервиса.
 
-    Дублирует логику find_free_port. Используется для поиска
-    портов инфраструктурных сервисов в start_infrastructure.
+    Используется для поиска портов инфраструктурных сервисов
+    в start_infrastructure.
 
     Args:
         default_port: Предпочитаемый порт
@@ -220,15 +285,9 @@ def get_available_port(default_port: int) -> int:
     Raises:
         RuntimeError: С указанием конкретного порта в ошибке
     """
-    port = default_port
-    while port < 65535:
-        try:
-            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                s.bind(('', port))
-                return port
-        except OSError:
-            port += 1
-    raise RuntimeError(f"Не могу найти свободный порт после {default_port}")
+    return _scan_for_free_port(
+        default_port, f"Не могу найти свободный порт после {default_port}"
+    )
 
 def is_port_free(port: int) -> bool:
     """
@@ -243,56 +302,130 @@ def is_port_free(port: int) -> bool:
     Returns:
         bool: True если порт свободен, False если занят
     """
-    try:
-        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-            s.bind(('', port))
+    with _make_probe_socket() as sock:
+        try:
+            sock.bind(('', port))
             return True
-    except OSError:
-        return False
+        except OSError:
+            return False
+
+# Ограничение числа одновременных проверок портов
+MAX_PORT_PROBE_WORKERS = 20
+
+def check_ports_free(ports: list[int]) -> list[bool]:
+    """
+    Параллельно проверяет доступность нескольких портов.
+
+    Каждая проверка - отдельный bind, поэтому они выполняются
+    в пуле потоков одновременно, а не друг за другом.
+
+    Args:
+        ports: Список портов для проверки
+
+    Returns:
+        list[bool]: Для каждого порта True если он свободен, в том же порядке
+    """
+    if not ports:
+        return []
+    with ThreadPoolExecutor(max_workers=min(len(ports), MAX_PORT_PROBE_WORKERS)) as executor:
+        return list(executor.map(is_port_free, ports))
+
+def get_available_ports(default_ports: dict[str, int]) -> dict[str, int]:
+    """
+    Параллельно подбирает свободные порты для нескольких сервисов.
+
+    Поиск для всех сервисов запускается одновременно. Если двум сервисам
+    достался один и тот же порт, порты подбираются заново последовательно,
+    пропуская уже выданные.
+
+    Args:
+        default_ports: Предпочитаемые порты по именам сервисов
+
+    Returns:
+        dict[str, int]: Свободные порты по именам сервисов
+    """
+    if not default_ports:
+        return {}
+    services = list(default_ports)
+    with ThreadPoolExecutor(max_workers=min(len(services), MAX_PORT_PROBE_WORKERS)) as executor:
+        found = list(executor.map(get_available_port, default_ports.values()))
+
+    if len(set(found)) == len(found):
+        return dict(zip(services, found))
+
+    # Коллизия: последовательный поиск с учетом уже выданных портов
+    ports = {}
+    for service, default_port in default_ports.items():
+        port = get_available_port(default_port)
+        while port in ports.values():
+            port = get_available_port(port + 1)
+        ports[service] = port
+    return ports
 
 def get_port(service: str) -> int:
     """
     Получает порт сервиса из переменных окружения или дефолтный.
 
-    Преобразует имя сервиса в формат переменной окружения
-    и ищет значение. Fallback на DEFAULT_PORTS.
+    Ищет значение в переменных окружения с fallback на DEFAULT_PORTS.
 
     Args:
-        service: Имя сервиса (например 'REDIS_PORT')
+        service: Имя переменной окружения (например 'REDIS_PORT')
 
     Returns:
         int: Номер порта для сервиса
-
-    Note:
-        Убирает '_PORT' из имени и приводит к верхнему регистру
     """
-    service_upper = service.upper().replace('_PORT', '')
-    return int(os.getenv(service, DEFAULT_PORTS[service_upper]))
+    return int(os.getenv(service, _DEFAULT_PORT_BY_ENV_KEY[service]))
 
-def show_loader(message: str, stop_event: threading.Event):
+def run_with_status_line(argv: list[str], **kwargs) -> None:
     """
-    Показывает анимированный loader
+    Запускает команду, показывая её вывод одной строкой статуса.
+
+    Вывод читается построчно из pipe. В терминале каждая новая строка
+    перерисовывает строку статуса через возврат каретки; вне терминала
+    (CI, перенаправление в файл) строки печатаются как есть.
 
     Args:
-        message: Сообщение для отображения
-        stop_event: Событие для остановки анимации
+        argv: Команда и её аргументы
+        **kwargs: Дополнительные аргументы для subprocess.Popen (cwd, env)
+
+    Raises:
+        subprocess.CalledProcessError: Если команда завершилась с ошибкой.
+            Полный вывод команды доступен в e.output
     """
-    chars = "⠋⠙⠹⠸⠼⠴⠦⠧⠇⠏"
-    i = 0
-    while not stop_event.is_set():
-        sys.stdout.write(f'\r{chars[i % len(chars)]} {message}')
+    is_tty = sys.stdout.isatty()
+    width = shutil.get_terminal_size().columns - 1
+    output = []
+    with subprocess.Popen(
+        argv,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        bufsize=1,
+        **kwargs
+    ) as process:
+        for line in process.stdout:
+            output.append(line)
+            status = line.strip()
+            if not status:
+                continue
+            if is_tty:
+                sys.stdout.write(f"\r{status[:width]:<{width}}")
+                sys.stdout.flush()
+            else:
+                print(status)
+    if is_tty:
+        sys.stdout.write(f"\r{'':<{width}}\r")
         sys.stdout.flush()
-        time.sleep(0.1)
-        i += 1
-    sys.stdout.write('\r' + ' ' * (len(message) + 2) + '\r')
-    sys.stdout.flush()
+    if process.returncode:
+        raise subprocess.CalledProcessError(process.returncode, argv, output="".join(output))
 
-def check_service(name: str, port: int, retries: int = 10, delay: int = 3) -> bool:
+async def check_service_async(name: str, port: int, retries: int = 10, delay: int = 3) -> bool:
     """
     Проверяет доступность сервиса через TCP подключение.
 
     Базовая функция для ожидания готовности сервисов после
-    запуска контейнеров. Делает несколько попыток с задержкой.
+    запуска контейнеров. Делает несколько попыток с задержкой;
+    каждая попытка подключения ограничена таймаутом в 1 секунду.
 
     Args:
         name: Имя сервиса для логирования
@@ -303,15 +436,17 @@ def check_service(name: str, port: int, retries: int = 10, delay: int = 3) -> bo
     Returns:
         bool: True если сервис отвечает, False если недоступен
     """
-    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
     for _ in range(retries):
         try:
-            sock.connect(('localhost', port))
-            sock.close()
+            _, writer = await asyncio.wait_for(
+                asyncio.open_connection('localhost', port), timeout=1
+            )
+            writer.close()
+            await writer.wait_closed()
             return True
-        except:
+        except (OSError, asyncio.TimeoutError):
             print(f"⏳ Ждём {name} на порту {port}...")
-            time.sleep(delay)
+            await asyncio.sleep(delay)
     return False
 
 def check_services():
@@ -319,14 +454,15 @@ def check_services():
     Проверяет готовность всех инфраструктурных сервисов.
 
     Вызывается после docker-compose up для ожидания полной
-    готовности Redis, RabbitMQ и PostgreSQL. Использует
-    разное количество попыток для разных сервисов.
+    готовности Redis, RabbitMQ и PostgreSQL. Сервисы проверяются
+    одновременно, поэтому общее ожидание равно ожиданию самого
+    медленного сервиса, а не сумме.
 
     Returns:
         bool: True если все сервисы готовы, False при таймауте
 
     Note:
-        PostgreSQL получает 30 попыток, остальные по 5
+        PostgreSQL получает 30 попыток, RabbitMQ 20, Redis 5
     """
     services_config = {
         'Redis': ('REDIS_PORT', 5),
@@ -334,39 +470,117 @@ def check_services():
         'PostgreSQL': ('POSTGRES_PORT', 30),
     }
 
-    for service_name, (port_key, retries) in services_config.items():
-        # Берем порт из переменных окружения (которые мы установили выше)
-        port = int(os.environ.get(port_key, get_port(port_key)))
-        if not check_service(service_name, port, retries):
+    # Берем порты из переменных окружения (которые мы установили выше)
+    service_ports = {
+        service_name: get_port(port_key)
+        for service_name, (port_key, _) in services_config.items()
+    }
+
+    async def check_all() -> list[bool]:
+        return await asyncio.gather(*(
+            check_service_async(service_name, service_ports[service_name], retries)
+            for service_name, (_, retries) in services_config.items()
+        ))
+
+    results = asyncio.run(check_all())
+
+    all_ready = True
+    for (service_name, port), is_ready in zip(service_ports.items(), results):
+        if not is_ready:
             print(f"❌ {service_name} не доступен на порту {port}!")
-            return False
-    return True
+            all_ready = False
+    return all_ready
+
+@lru_cache(maxsize=None)
+def resolve_executable(name: str) -> str:
+    """
+    Находит абсолютный путь к исполняемому файлу инструмента.
+
+    Поиск по PATH выполняется один раз для каждого имени, дальше
+    subprocess получает готовый путь. На Windows shutil.which сам
+    подставляет расширение (.exe, .cmd).
+
+    Args:
+        name: Имя команды (например 'alembic')
+
+    Returns:
+        str: Абсолютный путь к исполняемому файлу
+
+    Raises:
+        FileNotFoundError: Если команда не найдена в PATH
+    """
+    path = shutil.which(name)
+    if path is None:
+        raise FileNotFoundError(
+            f"❌ Команда {name} не найдена. Установите зависимости проекта (включая dev)"
+        )
+    return path
+
+@lru_cache(maxsize=1)
+def is_docker_available() -> bool:
+    """
+    Проверяет, установлен ли Docker CLI.
+
+    Ищет docker в PATH через shutil.which без запуска отдельного процесса.
+    Результат кешируется на время работы команды.
+
+    Returns:
+        bool: True если команда docker найдена
+    """
+    return shutil.which("docker") is not None
+
+@lru_cache(maxsize=1)
+def get_compose_command() -> tuple[str, ...]:
+    """
+    Определяет команду запуска Docker Compose.
+
+    Предпочитает плагин Compose v2 (docker compose), который не тратит
+    время на распаковку при каждом запуске, как legacy docker-compose.
+    Если плагин не установлен - используется docker-compose.
+    Результат кешируется на время работы команды.
 
+    Returns:
+        tuple[str, ...]: Префикс команды Compose
+    """
+    if is_docker_available():
+        result = subprocess.run(
+            ["docker", "compose", "version"],
+            capture_output=True,
+            text=True
+        )
+        if result.returncode == 0:
+            return ("docker", "compose")
+    return ("docker-compose",)
+
+@lru_cache(maxsize=1)
 def get_postgres_container_name() -> str:
     """
     Определяет имя контейнера PostgreSQL или fallback для прямого подключения.
 
-    Пытается найти запущенный контейнер через docker ps с фильтром по имени.
-    Если Docker недоступен или контейнер не найден - возвращает "postgres"
-    для прямого подключения к локальной БД.
+    Сначала ищет контейнер в списке, уже полученном start_infrastructure,
+    затем через docker ps с фильтром по имени. Если Docker недоступен
+    или контейнер не найден - возвращает "postgres" для прямого
+    подключения к локальной БД.
 
     Returns:
         str: Имя контейнера PostgreSQL или "postgres" для прямого подключения
 
     Note:
-        Используется в create_database() для выбора метода подключения
+        Используется в get_postgres_real_port(). Результат кешируется;
+        для повторного поиска вызовите get_postgres_container_name.cache_clear()
     """
     try:
         # Проверяем, доступен ли Docker
-        which_result = subprocess.run(
-            ["which", "docker"],
-            capture_output=True,
-            text=True
-        )
-        if which_result.returncode != 0:
+        if not is_docker_available():
             print("ℹ️ Docker не найден, используем прямое подключение к PostgreSQL")
             return "postgres"  # Стандартное имя для прямого подключения
 
+        # Compose сохраняет имена контейнеров между перезапусками,
+        # поэтому список из start_infrastructure остаётся актуальным
+        for name in _LAST_DOCKER_PS:
+            if "postgres" in name:
+                return name
+
         result = subprocess.run(
             ["docker", "ps", "--filter", "name=postgres", "--format", "{{.Names}}"],
             capture_output=True,
@@ -415,88 +629,51 @@ def get_postgres_real_port() -> int:
         print(f"⚠️ Не удалось получить порт PostgreSQL: {e}")
         return 5432
 
-def create_database():
+async def create_database_async():
     """
     Создаёт базу данных если она не существует.
 
-    Поддерживает два режима:
-    1. Через Docker exec в контейнер PostgreSQL
-    2. Прямое подключение через psql (если Docker недоступен)
-
-    Получает настройки из .env.dev, проверяет существование БД
-    через SQL запрос, создаёт если отсутствует.
+    Подключается к системной БД postgres через asyncpg и за одно
+    соединение проверяет наличие БД и при необходимости создаёт её.
+    Работает одинаково для контейнера PostgreSQL (через проброшенный
+    порт) и для локальной БД, без запуска docker exec или psql.
 
     Returns:
         bool: True при успехе, False при ошибке
-
-    Note:
-        Использует PGPASSWORD для передачи пароля в psql
     """
     print("🛠️ Проверяем наличие базы данных...")
 
     # Получаем данные из переменных окружения
     db_config = load_env_vars()
 
-    # Получаем имя контейнера PostgreSQL динамически
-    postgres_container = get_postgres_container_name()
-    print(f"🔍 Используем PostgreSQL: {postgres_container}")
-
     # Извлекаем настройки БД
     user = db_config.get('POSTGRES_USER', 'postgres')
     password = db_config.get('POSTGRES_PASSWORD', '')
     host = db_config.get('POSTGRES_HOST', 'localhost')
-    port = db_config.get('POSTGRES_PORT', '5432')
+    port = int(db_config.get('POSTGRES_PORT', '5432'))
     db_name = db_config.get('POSTGRES_DB', 'tarotbot_db')
 
     try:
-        # Проверяем, доступен ли Docker
-        which_docker = subprocess.run(["which", "docker"], capture_output=True)
-        docker_available = which_docker.returncode == 0
-
-        if docker_available:
-            # Метод с использованием Docker
-            check_db_inside = subprocess.run(
-                ["docker", "exec", "-i", postgres_container, "psql", "-U", user, "-c",
-                f"SELECT 1 FROM pg_database WHERE datname = '{db_name}';"],
-                capture_output=True, text=True
-            )
-
-            if "1 row" not in check_db_inside.stdout:
-                print(f"🛠️ База данных {db_name} не найдена внутри контейнера, создаём...")
-                create_cmd = [
-                    "docker", "exec", "-i", postgres_container, "psql", "-U", user, "-c",
-                    f"CREATE DATABASE {db_name};"
-                ]
-                subprocess.run(create_cmd, check=True)
-                print(f"✅ База данных {db_name} создана внутри контейнера!")
-            else:
-                print(f"✅ База данных {db_name} существует внутри контейнера!")
-        else:
-            # Прямое подключение через psql
-            print(f"🔄 Проверяем БД напрямую через psql...")
-
-            # Формируем команду для проверки существования БД
-            psql_command = f"psql -U {user} -h {host} -p {port}"
-            if password:
-                # Установка переменной окружения PGPASSWORD для передачи пароля
-                env = os.environ.copy()
-                env["PGPASSWORD"] = password
-            else:
-                env = os.environ.copy()
-
-            # Проверяем существование БД
-            check_db = subprocess.run(
-                f"{psql_command} -c \"SELECT 1 FROM pg_database WHERE datname = '{db_name}';\"",
-                shell=True, env=env, capture_output=True, text=True
+        conn = await asyncpg.connect(
+            user=user,
+            password=password,
+            host=host,
+            port=port,
+            database='postgres'  # Подключаемся к системной БД
+        )
+        try:
+            exists = await conn.fetchval(
+                "SELECT 1 FROM pg_database WHERE datname = $1", db_name
             )
-
-            if "1 row" not in check_db.stdout:
+            if not exists:
                 print(f"🛠️ База данных {db_name} не найдена, создаём...")
-                create_cmd = f"{psql_command} -c \"CREATE DATABASE {db_name};\""
-                subprocess.run(create_cmd, shell=True, env=env, check=True)
+                quoted_name = db_name.replace('"', '""')
+                await conn.execute(f'CREATE DATABASE "{quoted_name}"')
                 print(f"✅ База данных {db_name} создана!")
             else:
                 print(f"✅ База данных {db_name} существует!")
+        finally:
+            await conn.close()
 
         # Выводим информацию о подключении
         dsn = f"postgresql://{user}:*******@{host}:{port}/{db_name}"
@@ -507,6 +684,10 @@ def create_database():
         print(f"❌ Ошибка при работе с базой данных: {e}")
         return False
 
+def create_database():
+    """Синхронная обертка для асинхронной функции"""
+    return asyncio.run(create_database_async())
+
 
 def start_infrastructure():
     """
@@ -534,15 +715,19 @@ def start_infrastructure():
 
     env_vars = load_env_vars()
 
-    busy_ports = []
+    # Получаем порты из .env.dev или используем дефолтные.
     # Исключаем FASTAPI из проверки, он сам найдет свободный порт
-    infrastructure_ports = {k: v for k, v in DEFAULT_PORTS.items() if k != 'FASTAPI' and k != 'POSTGRES'}
-
-    for service, default_port in infrastructure_ports.items():
-        # Получаем порт из .env.dev или используем дефолтный
-        port = int(env_vars.get(f"{service}_PORT", default_port))
-        if not is_port_free(port):
-            busy_ports.append(f"{service}: {port}")
+    configured_ports = {
+        service: int(env_vars.get(f"{service}_PORT", default_port))
+        for service, default_port in DEFAULT_PORTS.items()
+        if service not in ('FASTAPI', 'POSTGRES')
+    }
+    port_states = check_ports_free(list(configured_ports.values()))
+    busy_ports = [
+        f"{service}: {port}"
+        for (service, port), is_free in zip(configured_ports.items(), port_states)
+        if not is_free
+    ]
 
     if busy_ports:
         print("❌ Следующие порты заняты:")
@@ -552,10 +737,12 @@ def start_infrastructure():
         return False
 
     try:
-        # Проверяем статус Docker
+        # Проверяем статус Docker и запущенные контейнеры одним вызовом:
+        # docker ps падает так же, как docker info, если демон недоступен
+        print("🔍 Проверяем запущенные контейнеры...")
         try:
-            docker_info = subprocess.run(
-                ["docker", "info"],
+            ps_result = subprocess.run(
+                ["docker", "ps", "--format", "{{.Names}}"],
                 capture_output=True,
                 text=True,
                 check=True
@@ -572,17 +759,10 @@ def start_infrastructure():
                 print("   3. Нет конфликтов с WSL или другими службами")
             raise DockerDaemonNotRunningError()
 
-        # Проверяем запущенные контейнеры
-        print("🔍 Проверяем запущенные контейнеры...")
-        ps_result = subprocess.run(
-            ["docker", "ps", "--format", "{{.Names}}"],
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        if ps_result.stdout.strip():
+        _LAST_DOCKER_PS[:] = [name for name in ps_result.stdout.strip().split('\n') if name]
+        if _LAST_DOCKER_PS:
             print("⚠️ Найдены запущенные контейнеры:")
-            for container in ps_result.stdout.strip().split('\n'):
+            for container in _LAST_DOCKER_PS:
                 print(f"   - {container}")
 
         # Убиваем все контейнеры
@@ -594,9 +774,16 @@ def start_infrastructure():
                 raise DockerDaemonNotRunningError()
             raise
 
-        # Очищаем тома
+        # Очищаем тома, только если есть неиспользуемые
         try:
-            subprocess.run(["docker", "volume", "prune", "-f"], check=True)
+            dangling_volumes = subprocess.run(
+                ["docker", "volume", "ls", "-q", "--filter", "dangling=true"],
+                capture_output=True,
+                text=True,
+                check=True
+            ).stdout.strip()
+            if dangling_volumes:
+                subprocess.run(["docker", "volume", "prune", "-f"], check=True)
         except subprocess.CalledProcessError as e:
             error_output = str(e)
             if "docker daemon is not running" in error_output or "pipe/docker_engine" in error_output:
@@ -604,24 +791,24 @@ def start_infrastructure():
             raise
 
         # Получаем порты из .env.dev или дефолтные
-        ports = {}
-        for service, default_port in DEFAULT_PORTS.items():
-            if service == 'POSTGRES':
-                # Для PostgreSQL берем порт из .env.dev
-                postgres_port = int(env_vars.get('POSTGRES_PORT', default_port))
-                if not is_port_free(postgres_port):
-                    print(f"❌ Порт {postgres_port} для PostgreSQL занят!")
-                    print(f"💡 Освободи порт {postgres_port} или измени POSTGRES_PORT в .env.dev")
-                    return False
-                ports[service] = postgres_port
-            else:
-                ports[service] = get_available_port(default_port)
+        # Для PostgreSQL берем порт из .env.dev
+        postgres_port = int(env_vars.get('POSTGRES_PORT', DEFAULT_PORTS['POSTGRES']))
+        if not is_port_free(postgres_port):
+            print(f"❌ Порт {postgres_port} для PostgreSQL занят!")
+            print(f"💡 Освободи порт {postgres_port} или измени POSTGRES_PORT в .env.dev")
+            return False
 
+        # Для остальных сервисов подбираем свободные порты параллельно
+        available_ports = get_available_ports(
+            {service: port for service, port in DEFAULT_PORTS.items() if service != 'POSTGRES'}
+        )
         # Используем порты в docker-compose через переменные окружения
-        env_for_compose = {
-            f"{service}_PORT": str(port)
-            for service, port in ports.items()
-        }
+        ports = {}
+        env_for_compose = {}
+        for service in DEFAULT_PORTS:
+            port = available_ports.get(service, postgres_port)
+            ports[service] = port
+            env_for_compose[f"{service}_PORT"] = str(port)
 
         # ВАЖНО: Обновляем переменные окружения для текущего процесса
         # чтобы alembic и settings видели правильные порты
@@ -631,33 +818,31 @@ def start_infrastructure():
         for service, port in ports.items():
             print(f"   {service}: {port}")
 
-        # Запуск контейнеров с loader
-        stop_loader = threading.Event()
-        loader_thread = threading.Thread(target=show_loader, args=("", stop_loader))
-        loader_thread.start()
-
+        # Запуск контейнеров с выводом прогресса в строку статуса
         try:
-            run_compose_command(["up", "-d"], COMPOSE_FILE_WITHOUT_BACKEND, env=env_for_compose)
+            run_compose_command(
+                ["up", "-d"], COMPOSE_FILE_WITHOUT_BACKEND, env=env_for_compose, show_progress=True
+            )
         except subprocess.CalledProcessError as e:
             error_output = str(e)
             if "docker daemon is not running" in error_output or "pipe/docker_engine" in error_output:
                 raise DockerDaemonNotRunningError()
             elif "Conflict" in error_output and "is already in use by container" in error_output:
                 # Извлекаем имя контейнера из сообщения об ошибке
-                import re
                 container_match = re.search(r'The container name "([^"]+)"', error_output)
                 container_name = container_match.group(1) if container_match else None
                 raise DockerContainerConflictError(container_name)
             raise
-        finally:
-            stop_loader.set()
-            loader_thread.join()
-            print("✅ Контейнеры запущены!")
+        print("✅ Контейнеры запущены!")
+
+        # Контейнеры пересозданы: имя PostgreSQL определяем заново
+        get_postgres_container_name.cache_clear()
 
         # Ждем доступности сервисов
         check_services()
-        # Отладка переменных окружения
-        debug_env_vars()
+        # Отладка переменных окружения (включается через DEV_DEBUG_ENV)
+        if os.environ.get("DEV_DEBUG_ENV"):
+            debug_env_vars()
         # Создаем базу данных после успешного поднятия PostgreSQL
         create_database()
         # Запускаем миграции после успешного поднятия PostgreSQL
@@ -736,6 +921,11 @@ def test_db_connection():
 def debug_env_vars():
     """
     Выводит все переменные окружения связанные с БД для отладки.
+
+    Note:
+        В start_infrastructure() вызывается только при заданной
+        переменной окружения DEV_DEBUG_ENV. Settings импортируются
+        внутри функции, чтобы увидеть уже обновлённые порты
     """
     print("\n" + "="*60)
     print("🔍 ОТЛАДКА ПЕРЕМЕННЫХ ОКРУЖЕНИЯ")
@@ -769,7 +959,7 @@ def debug_env_vars():
         print(f"   POSTGRES_HOST: {settings.POSTGRES_HOST}")
         print(f"   POSTGRES_PORT: {settings.POSTGRES_PORT}")
         print(f"   POSTGRES_DB: {settings.POSTGRES_DB}")
-        print(f"   DATABASE_URL: {settings.database_url}")
+        print(f"   DATABASE_URL: {settings.database_dsn}")
     except Exception as e:
         print(f"   ❌ Ошибка загрузки settings: {e}")
 
@@ -834,7 +1024,7 @@ def dev(port: Optional[int] = None):
 
     Выполняет полный цикл подготовки и запуска:
     1. start_infrastructure() - поднимает всю инфраструктуру
-    2. find_free_port() - находит свободный порт для FastAPI
+    2. get_port() - берёт порт FastAPI, подобранный при запуске инфраструктуры
     3. uvicorn.run() - запускает сервер с hot reload
 
     Args:
@@ -850,16 +1040,21 @@ def dev(port: Optional[int] = None):
         return
 
     if port is None:
-        port = find_free_port()
-
-
-    print("\n" + "="*60)
-    print("🚀 ЗАПУСК FASTAPI СЕРВЕРА")
-    print("="*60)
-    print(f"🌐 Адрес: http://localhost:{port}")
-    print(f"📚 Документация: http://localhost:{port}/docs")
-    print(f"🔄 Hot Reload: включён")
-    print("="*60 + "\n")
+        # Свободный порт уже подобран в start_infrastructure()
+        port = get_port('FASTAPI_PORT')
+
+    separator = "=" * 60
+    # Баннер выводится одной записью, чтобы не перемешиваться с логами
+    sys.stdout.write(
+        f"\n{separator}\n"
+        "🚀 ЗАПУСК FASTAPI СЕРВЕРА\n"
+        f"{separator}\n"
+        f"🌐 Адрес: http://localhost:{port}\n"
+        f"📚 Документация: http://localhost:{port}/docs\n"
+        "🔄 Hot Reload: включён\n"
+        f"{separator}\n\n"
+    )
+    sys.stdout.flush()
 
     uvicorn.run(
         "app.main:app",
@@ -881,19 +1076,30 @@ def serve(port: Optional[int] = None):
     Args:
         port: Порт для сервера. Если None - автопоиск
 
+    Note:
+        На Linux/macOS процесс заменяется на uvicorn через os.execvp,
+        поэтому после serve() код не выполняется
     """
     if port is None:
         port = find_free_port()
 
     print(f"🚀 Запускаем сервер на порту {port}")
-    subprocess.run([
-        "uvicorn",
+    argv = [
+        resolve_executable("uvicorn"),
         "app.main:app",
         "--host", "0.0.0.0",
         "--port", str(port),
         "--proxy-headers",
         "--forwarded-allow-ips=*"
-    ], check=True)
+    ]
+    if platform.system() == "Windows":
+        # На Windows exec не заменяет процесс, а запускает новый
+        subprocess.run(argv, check=True)
+        return
+
+    # После сервера делать нечего: заменяем текущий процесс на uvicorn
+    sys.stdout.flush()
+    os.execvp(argv[0], argv)
 
 def migrate():
     """
@@ -909,7 +1115,7 @@ def migrate():
     Note:
         Требует настроенного alembic.ini и доступной БД
     """
-    subprocess.run(["alembic", "upgrade", "head"], check=True)
+    subprocess.run([resolve_executable("alembic"), "upgrade", "head"], check=True)
 
 def format():
     """
@@ -925,8 +1131,99 @@ def format():
     Note:
         Изменяет файлы на месте без подтверждения
     """
-    subprocess.run(["black", "app/"], check=True)
-    subprocess.run(["isort", "app/"], check=True)
+    subprocess.run([resolve_executable("black"), "app/"], check=True)
+    subprocess.run([resolve_executable("isort"), "app/"], check=True)
+
+# Группы ошибок flake8 по кодам для вывода в check()
+FLAKE8_ERROR_GROUPS = {
+    'E501': 'Длинные строки',
+    'F821': 'Неопределенные переменные',
+    'F841': 'Неиспользуемые переменные',
+    'W605': 'Некорректные escape-последовательности',
+    'E262': 'Неправильные комментарии'
+}
+_FLAKE8_GROUPED_CODE_RE = re.compile(rf"\b({'|'.join(FLAKE8_ERROR_GROUPS)})\b")
+
+def _report_mypy(output: str, returncode: int) -> bool:
+    """
+    Выводит результат mypy с группировкой ошибок по типам.
+
+    Args:
+        output: Стандартный вывод mypy
+        returncode: Код завершения mypy
+
+    Returns:
+        bool: True если mypy не нашёл ошибок
+    """
+    if returncode:
+        print("❌ Найдены ошибки mypy:")
+        print(output)
+        return False
+
+    mypy_error_groups = {
+        'error: Incompatible': 'Несовместимые типы',
+        'error: Name': 'Ошибки именования',
+        'error: Missing': 'Отсутствующие типы',
+        'error: Argument': 'Ошибки аргументов',
+        'error: Return': 'Ошибки возвращаемых значений'
+    }
+
+    # Раскладываем ошибки по группам за один проход
+    grouped_errors = defaultdict(list)
+    for error in output.split('\n'):
+        if not error:
+            continue
+        desc = next(
+            (desc for pattern, desc in mypy_error_groups.items() if pattern in error),
+            'Прочие ошибки'
+        )
+        grouped_errors[desc].append(error)
+
+    # Известные группы в исходном порядке, "Прочие" в конце
+    for desc in [*mypy_error_groups.values(), 'Прочие ошибки']:
+        if desc in grouped_errors:
+            # Группа выводится одной записью, а не print на каждую строку
+            sys.stdout.write(
+                f"\n🔍 MyPy - {desc}:\n" + "".join(f"- {error}\n" for error in grouped_errors[desc])
+            )
+    return True
+
+def _report_flake8(lines: Iterable[str], returncode: int) -> bool:
+    """
+    Выводит результат flake8 с группировкой ошибок по кодам.
+
+    Вывод читается построчно, поэтому его можно передать открытым
+    файлом без загрузки целиком в память.
+
+    Args:
+        lines: Строки стандартного вывода flake8
+        returncode: Код завершения flake8
+
+    Returns:
+        bool: True если flake8 не нашёл ошибок
+    """
+    if returncode:
+        print("❌ Найдены ошибки flake8: ")
+        sys.stdout.writelines(lines)
+        return False
+
+    # Раскладываем ошибки по кодам за один проход
+    grouped_errors = defaultdict(list)
+    for line in lines:
+        error = line.rstrip('\n')
+        if not error:
+            continue
+        match = _FLAKE8_GROUPED_CODE_RE.search(error)
+        grouped_errors[match.group(1) if match else None].append(error)
+
+    # Известные группы в исходном порядке, "Прочие" в конце
+    for code, desc in [*FLAKE8_ERROR_GROUPS.items(), (None, 'Прочие ошибки')]:
+        if code in grouped_errors:
+            sys.stdout.write(
+                f"\n🔍 Flake8 - {desc}:\n"
+                + "".join(f"- {error.partition(':')[0]}\n" for error in grouped_errors[code])
+            )
+    return True
 
 def check():
     """
@@ -941,91 +1238,26 @@ def check():
         bool: True если проверки прошли без ошибок
 
     Note:
-        Продолжает выполнение даже при ошибках одного из инструментов
+        flake8 запускается отдельным процессом, а mypy в это время
+        работает в текущем интерпретаторе через mypy.api, поэтому
+        общее время равно времени самого медленного из них и не
+        тратится на запуск ещё одного Python. Результат каждого
+        выводится даже при ошибках другого
     """
-    mypy_success = True
-    flake8_success = True
+    from mypy import api as mypy_api
 
-    # Проверка mypy
-    try:
-        mypy_result = subprocess.run(
-            ["mypy", "app/"],
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        mypy_errors = mypy_result.stdout.split('\n')
-
-        mypy_error_groups = {
-            'error: Incompatible': 'Несовместимые типы',
-            'error: Name': 'Ошибки именования',
-            'error: Missing': 'Отсутствующие типы',
-            'error: Argument': 'Ошибки аргументов',
-            'error: Return': 'Ошибки возвращаемых значений'
-        }
-
-        # Сначала собираем все ошибки в известные группы
-        grouped_errors = set()
-        for pattern, desc in mypy_error_groups.items():
-            matches = [e for e in mypy_errors if pattern in e]
-            if matches:
-                print(f"\n🔍 MyPy - {desc}:")
-                for error in matches:
-                    print(f"- {error}")
-                    grouped_errors.add(error)
-
-        # Оставшиеся ошибки выводим как "Прочие"
-        other_errors = [e for e in mypy_errors if e and e not in grouped_errors]
-        if other_errors:
-            print("\n🔍 MyPy - Прочие ошибки:")
-            for error in other_errors:
-                print(f"- {error}")
-    except subprocess.CalledProcessError as e:
-        print("❌ Найдены ошибки mypy:")
-        print(e.stdout)
-        mypy_success = False
-
-    # Проверка flake8
-    try:
-        result = subprocess.run(
-            ["flake8", "app/"],
-            capture_output=True,
-            text=True,
-            check=True
+    # Вывод flake8 пишется во временный файл, чтобы заполненный pipe
+    # не останавливал flake8, пока mypy работает
+    with tempfile.TemporaryFile(mode="w+") as flake8_stdout:
+        flake8_process = subprocess.Popen(
+            [resolve_executable("flake8"), "app/"], stdout=flake8_stdout, stderr=subprocess.DEVNULL, text=True
         )
-        flake8_errors = result.stdout.split('\n')
-
-        # Группируем ошибки по типу
-        error_groups = {
-            'E501': 'Длинные строки',
-            'F821': 'Неопределенные переменные',
-            'F841': 'Неиспользуемые переменные',
-            'W605': 'Некорректные escape-последовательности',
-            'E262': 'Неправильные комментарии'
-        }
-
-        # Собираем известные ошибки
-        grouped_errors = set()
-        for code, desc in error_groups.items():
-            matches = [e for e in flake8_errors if code in e]
-            if matches:
-                print(f"\n🔍 Flake8 - {desc}:")
-                for error in matches:
-                    print(f"- {error.split(':')[0]}")
-                    grouped_errors.add(error)
-
-        # Выводим оставшиеся ошибки
-        other_errors = [e for e in flake8_errors if e and e not in grouped_errors]
-        if other_errors:
-            print("\n🔍 Flake8 - Прочие ошибки:")
-            for error in other_errors:
-                print(f"- {error.split(':')[0]}")
-
-    except subprocess.CalledProcessError as e:
-        print("❌ Найдены ошибки flake8: ")
-        print(e.stdout)
-        flake8_success = False
+        mypy_output, _, mypy_returncode = mypy_api.run(["app/"])
+        flake8_process.wait()
 
+        mypy_success = _report_mypy(mypy_output, mypy_returncode)
+        flake8_stdout.seek(0)
+        flake8_success = _report_flake8(flake8_stdout, flake8_process.returncode)
     return mypy_success and flake8_success
 
 def lint():
@@ -1055,6 +1287,11 @@ def test(
         marker: Маркер для фильтрации (@pytest.mark.unit и т.д.)
         verbose: Подробный вывод
         output_file: Файл для сохранения результатов
+
+    Note:
+        pytest запускается через pytest.main в текущем интерпретаторе,
+        без отдельного процесса и повторного старта Python. Процесс
+        завершается с кодом возврата pytest
     """
     print("🧪 Подготовка тестового окружения...")
 
@@ -1062,29 +1299,34 @@ def test(
         print("❌ Не удалось создать тестовую базу данных")
         return
 
-    env = os.environ.copy()
-    env["DEV_ENV_FILE"] = ".env.test"
+    # pytest работает в текущем процессе, поэтому настройки берутся
+    # из окружения этого процесса
+    os.environ["DEV_ENV_FILE"] = ".env.test"
 
-    cmd = ["pytest", path]
+    args = [path]
 
     if verbose:
-        cmd.append("-v")
+        args.append("-v")
 
     if marker:
-        cmd.extend(["-m", marker])
+        args.extend(["-m", marker])
 
-    cmd.append("--tb=short")  # Короткий traceback
+    args.append("--tb=short")  # Короткий traceback
 
-    print(f"🚀 Запуск тестов: {' '.join(cmd)}")
+    print(f"🚀 Запуск тестов: pytest {' '.join(args)}")
 
-    try:
-        if output_file:
-            with open(output_file, "w") as f:
-                subprocess.run(cmd, env=env, stdout=f, stderr=subprocess.STDOUT, check=True)
-        else:
-            subprocess.run(cmd, env=env, check=True)
-    except subprocess.CalledProcessError:
-        pass
+    import pytest
+
+    if output_file:
+        # Построчная буферизация: результаты сразу видны в файле (удобно для tail -f)
+        with open(output_file, "w", buffering=1) as f:
+            with contextlib.redirect_stdout(f), contextlib.redirect_stderr(f):
+                exit_code = pytest.main(args)
+    else:
+        exit_code = pytest.main(args)
+
+    # Код возврата pytest становится кодом завершения команды (для CI)
+    sys.exit(exit_code)
 
 # def create_test_database():
 #     """
@@ -1176,14 +1418,32 @@ def test(
 #         print(f"❌ Ошибка при создании тестовой базы данных: {e}")
 #         return False
 
-import asyncio
-import asyncpg
-from sqlalchemy import create_engine, text
-from sqlalchemy.exc import OperationalError
+def _test_schema_fingerprint() -> str:
+    """
+    Считает отпечаток файлов, определяющих схему тестовой БД.
+
+    Returns:
+        str: blake2b хеш содержимого миграций и моделей
+    """
+    paths = sorted(
+        [
+            *ROOT_DIR.glob("app/core/migrations/versions/*.py"),
+            *ROOT_DIR.glob("app/models/**/*.py"),
+        ]
+    )
+    digest = hashlib.blake2b()
+    for path in paths:
+        digest.update(path.relative_to(ROOT_DIR).as_posix().encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
 
 async def create_test_database_async():
     """
     Создает тестовую базу данных используя asyncpg (без psql).
+
+    Если миграции и модели не менялись с прошлого запуска и БД уже
+    существует, она не пересоздаётся: все таблицы очищаются одним
+    TRUNCATE. Иначе БД удаляется и создаётся заново.
     """
     print("🛠️ Создаю тестовую базу данных...")
 
@@ -1203,6 +1463,12 @@ async def create_test_database_async():
     print(f"🔍 Подключение к {host}:{port} как {user}")
 
     try:
+        fingerprint = _test_schema_fingerprint()
+        try:
+            is_schema_unchanged = TEST_DB_FINGERPRINT_FILE.read_text() == fingerprint
+        except FileNotFoundError:
+            is_schema_unchanged = False
+
         # Подключаемся к postgres БД для создания тестовой БД
         conn = await asyncpg.connect(
             user=user,
@@ -1211,16 +1477,44 @@ async def create_test_database_async():
             port=port,
             database='postgres'  # Подключаемся к системной БД
         )
-
-        # Удаляем существующую тестовую БД если есть
-        await conn.execute(f'DROP DATABASE IF EXISTS "{test_db_name}"')
-        print(f"🗑️ Удалена существующая БД {test_db_name} (если была)")
-
-        # Создаем тестовую БД
-        await conn.execute(f'CREATE DATABASE "{test_db_name}"')
-        print(f"✅ Тестовая база данных {test_db_name} создана!")
-
-        await conn.close()
+        try:
+            exists = await conn.fetchval(
+                "SELECT 1 FROM pg_database WHERE datname = $1", test_db_name
+            )
+            if not (exists and is_schema_unchanged):
+                # Удаляем существующую тестовую БД если есть
+                await conn.execute(f'DROP DATABASE IF EXISTS "{test_db_name}"')
+                print(f"🗑️ Удалена существующая БД {test_db_name} (если была)")
+
+                # Создаем тестовую БД
+                await conn.execute(f'CREATE DATABASE "{test_db_name}"')
+                print(f"✅ Тестовая база данных {test_db_name} создана!")
+        finally:
+            await conn.close()
+
+        if exists and is_schema_unchanged:
+            # Схема не менялась: очищаем данные вместо пересоздания БД
+            test_conn = await asyncpg.connect(
+                user=user,
+                password=password,
+                host=host,
+                port=port,
+                database=test_db_name
+            )
+            try:
+                # alembic_version не очищается: иначе пропадёт отметка о миграциях
+                tables = await test_conn.fetch(
+                    "SELECT quote_ident(tablename) AS name FROM pg_tables "
+                    "WHERE schemaname = 'public' AND tablename <> 'alembic_version'"
+                )
+                if tables:
+                    table_names = ", ".join(table["name"] for table in tables)
+                    await test_conn.execute(f"TRUNCATE {table_names} RESTART IDENTITY CASCADE")
+            finally:
+                await test_conn.close()
+            print(f"✅ Тестовая база данных {test_db_name} очищена (схема не менялась)")
+        else:
+            TEST_DB_FINGERPRINT_FILE.write_text(fingerprint)
 
         # Выводим информацию о подключении
         test_dsn = f"postgresql://{user}:*******@{host}:{port}/{test_db_name}"